@@ -0,0 +1 @@
+"""Reproducible throughput and latency benchmarks for dateparserpython."""
@@ -0,0 +1,51 @@
+"""
+Compare two result files written by benchmarks.run.
+
+    python -m benchmarks.compare base.json head.json --threshold 0.10
+
+Exits with status 1 when any throughput dropped by more than the threshold
+or any workload found a different number of dates. Both come from the timed
+passes benchmarks.run makes after its warm-up, so pattern learning has
+settled and throughput is the fastest pass.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    with open(args.base, encoding="utf-8") as handle:
+        base = json.load(handle)
+    with open(args.head, encoding="utf-8") as handle:
+        head = json.load(handle)
+
+    regressions = 0
+    changed = 0
+    for key in sorted(set(base["results"]) & set(head["results"])):
+        before = base["results"][key]["chars_per_second"]
+        after = head["results"][key]["chars_per_second"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change < -args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        if base["results"][key]["dates"] != head["results"][key]["dates"]:
+            flag += "  DATE COUNT CHANGED"
+            changed += 1
+        print(f"{key:<28} {before / 1e6:8.2f} -> {after / 1e6:8.2f} Mchar/s {change:+7.1%}{flag}")
+    print(f"import {base['import_seconds'] * 1e3:.1f}ms -> {head['import_seconds'] * 1e3:.1f}ms")
+    return 1 if regressions or changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
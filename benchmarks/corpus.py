@@ -0,0 +1,106 @@
+"""Seeded corpus generator built from the parser's own pattern tables."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from dateparserpython import helper as Helper
+
+NOISE_WORDS = [
+    "request", "handled", "user", "session", "payload", "error", "warning", "thread",
+    "worker", "queue", "latency", "upstream", "cache", "retry", "timeout", "status",
+    "exception", "trace", "gateway", "response", "{", "}", "[", "]", "=", ":", ",",
+]
+
+
+@dataclass(frozen=True)
+class Corpus:
+    name: str
+    texts: List[str]
+
+    @property
+    def chars(self) -> int:
+        return sum(len(text) for text in self.texts)
+
+
+def _noise(rng: random.Random, length: int) -> str:
+    words: List[str] = []
+    size = 0
+    while size < length:
+        word = rng.choice(NOISE_WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def _dates(rng: random.Random) -> List[str]:
+    return Helper.testDataForDateFormats(rng)
+
+
+def shortLines(rng: random.Random, size: int) -> List[str]:
+    dates = _dates(rng)
+    return [f"{rng.choice(dates)} INFO {_noise(rng, rng.randint(20, 80))}" for _ in range(size)]
+
+
+def longDocument(rng: random.Random, size: int) -> List[str]:
+    dates = _dates(rng)
+    parts: List[str] = []
+    for _ in range(size):
+        parts.append(_noise(rng, rng.randint(50, 400)))
+        parts.append(rng.choice(dates))
+    return ["\n".join(parts)]
+
+
+def sparseLines(rng: random.Random, size: int) -> List[str]:
+    dates = _dates(rng)
+    lines = []
+    for _ in range(size):
+        line = _noise(rng, rng.randint(300, 600))
+        if rng.random() < 0.1:
+            cut = rng.randint(0, len(line))
+            line = f"{line[:cut]} {rng.choice(dates)} {line[cut:]}"
+        lines.append(line)
+    return lines
+
+
+def denseLines(rng: random.Random, size: int) -> List[str]:
+    dates = _dates(rng)
+    return [" | ".join(rng.choice(dates) for _ in range(rng.randint(3, 8))) for _ in range(size)]
+
+
+def uniformLines(rng: random.Random, size: int) -> List[str]:
+    # One timestamp format throughout, as pattern learning expects, with
+    # other numbers in about half of the messages.
+    lines = []
+    for _ in range(size):
+        stamp = (
+            f"{rng.randint(2000, 2030)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} "
+            f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+        )
+        numbers = f" pid={rng.randint(100, 99999)} took {rng.randint(1, 999)}ms" if rng.random() < 0.5 else ""
+        lines.append(f"{stamp} INFO{numbers} {_noise(rng, rng.randint(20, 80))}")
+    return lines
+
+
+def pureNoise(rng: random.Random, size: int) -> List[str]:
+    return [_noise(rng, rng.randint(100, 400)) for _ in range(size)]
+
+
+GENERATORS: Dict[str, Callable[[random.Random, int], List[str]]] = {
+    "short_lines": shortLines,
+    "long_document": longDocument,
+    "sparse_lines": sparseLines,
+    "dense_lines": denseLines,
+    "uniform_lines": uniformLines,
+    "pure_noise": pureNoise,
+}
+
+SIZES: Dict[str, int] = {"small": 200, "medium": 2000, "large": 20000}
+
+
+def buildCorpus(name: str, size: int, seed: int = 0) -> Corpus:
+    """Return the corpus ``name`` with ``size`` units; same seed, same text."""
+
+    return Corpus(name, GENERATORS[name](random.Random(f"{name}:{seed}"), size))
@@ -0,0 +1,155 @@
+"""
+Run the benchmark suite and write machine-readable results.
+
+    python -m benchmarks.run --size small --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import dateparserpython
+from dateparserpython import Parser
+
+from .corpus import GENERATORS, SIZES, Corpus, buildCorpus
+
+CONFIGS: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "prefilter": {"prefilter": True},
+    "learn": {"learn_pattern": True},
+    "learned_only": {"learn_pattern": True, "learned_only": True},
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(corpus: Corpus, parser: Parser, repeat: int) -> Dict[str, Any]:
+    """
+    Time ``repeat`` passes over the corpus after one discarded warm-up pass
+    (which fills the fragment caches and lets pattern learning settle) and
+    report the fastest; latency percentiles cover every timed pass.
+    """
+
+    for text in corpus.texts:
+        parser.parse(text)
+    latencies: List[float] = []
+    dates = 0
+    runs: List[float] = []
+    for _ in range(repeat):
+        dates = 0
+        total = 0.0
+        for text in corpus.texts:
+            started = time.perf_counter()
+            dates += len(parser.parse(text))
+            elapsed = time.perf_counter() - started
+            latencies.append(elapsed)
+            total += elapsed
+        runs.append(total)
+    best = min(runs)
+    return {
+        "inputs": len(corpus.texts),
+        "chars": corpus.chars,
+        "dates": dates,
+        "seconds": best,
+        "chars_per_second": corpus.chars / best if best else 0.0,
+        "dates_per_second": dates / best if best else 0.0,
+        "latency_us": {
+            "mean": statistics.fmean(latencies) * 1e6,
+            "p50": percentile(latencies, 0.50) * 1e6,
+            "p90": percentile(latencies, 0.90) * 1e6,
+            "p99": percentile(latencies, 0.99) * 1e6,
+            "max": max(latencies) * 1e6,
+        },
+    }
+
+
+def measureImport(runs: int = 7) -> float:
+    """
+    Median wall time of ``import dateparserpython`` in fresh interpreters.
+    A first, untimed run lets Python write the bytecode cache, as an
+    installed package would have it.
+    """
+
+    command = [sys.executable, "-c", "import time; t = time.perf_counter(); import dateparserpython; "
+               "print(time.perf_counter() - t)"]
+    samples = []
+    for _ in range(runs + 1):
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        samples.append(float(output.strip()))
+    return statistics.median(samples[1:])
+
+
+def gitRevision() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def runSuite(size: str, seed: int, repeat: int, corpora: List[str], configs: List[str]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name in corpora:
+        corpus = buildCorpus(name, SIZES[size], seed)
+        for config in configs:
+            parser = Parser(**CONFIGS[config])
+            results[f"{name}/{config}"] = measure(corpus, parser, repeat)
+    return {
+        "meta": {
+            "version": dateparserpython.__version__,
+            "revision": gitRevision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "size": size,
+            "seed": seed,
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "import_seconds": measureImport(),
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--corpus", action="append", choices=sorted(GENERATORS), help="default: all")
+    parser.add_argument("--config", action="append", choices=sorted(CONFIGS), help="default: all")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = runSuite(args.size, args.seed, args.repeat, args.corpus or list(GENERATORS), args.config or list(CONFIGS))
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+    print(f"{'import':<28} {report['import_seconds'] * 1e3:8.1f} ms", file=sys.stderr)
+    for key, result in report["results"].items():
+        print(
+            f"{key:<28} {result['chars_per_second'] / 1e6:8.2f} Mchar/s {result['dates_per_second']:10.0f} dates/s "
+            f"p50 {result['latency_us']['p50']:9.1f}us p99 {result['latency_us']['p99']:9.1f}us",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
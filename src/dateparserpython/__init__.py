@@ -1,7 +1,10 @@
 """Public package interface for dateparserpython."""
 
 from .parser import Parser
-from .models import DateElement, LocalDateModel
+from .cache import CacheInfo
+from .columns import DateColumns
+from .models import DateComponents, DateElement, LocalDateModel
+from .stats import ParserStats
 
 __version__ = "0.2.2"
 
@@ -9,5 +12,9 @@ __all__ = [
     "Parser",
     "LocalDateModel",
     "DateElement",
+    "DateComponents",
+    "DateColumns",
+    "CacheInfo",
+    "ParserStats",
     "__version__",
 ]
@@ -0,0 +1,223 @@
+# Generated by dateparserpython.dictionary.writeTables(); do not edit.
+
+SOURCE = (3,
+ ('january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october',
+  'november', 'december'),
+ ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'),
+ ('DDDD*DD*DD', 'DDDD*D*DD', 'DDDD*DD*D', 'DDDD*D*D', 'DD*DD*DD', 'DD*D*DD', 'DD*DD*D', 'DD*D*D',
+  'DD*DD*DDDD', 'D*DD*DDDD', 'DD*D*DDDD', 'D*D*DDDD', 'DD*DD*DD', 'D*DD*DD', 'DD*D*DD', 'D*D*DD',
+  'DDDD*M*DD', 'DDDD*M*D', 'DD*M*DD', 'DD*M*D', 'DD*M*DDDD', 'D*M*DDDD', 'DD*M*DD', 'D*M*DD',
+  'M*DD*DDDD', 'M*D*DDDD', 'M*DD*DD', 'M*D*DD', 'M*DD**DDDD', 'M*D**DDDD', 'M*DD**DD', 'M*D**DD'),
+ ('DD:DD:DD', 'DD:DD:DD ', 'DD:DD:DD.DDD', 'DD:DD:DD.DDD ', 'DD:DD:DD,DDD', 'DD:DD:DD,DDD ',
+  'D:DD:DD', 'D:DD:DD ', 'D:DD:DD.DDD', 'D:DD:DD.DDD ', 'D:DD:DD,DDD', 'D:DD:DD,DDD '),
+ '\\/ -.,:_', ' _-T')
+
+PATTERN_TABLE = ({42: 3, 68: 1, 77: 2, '*': 3, 'D': 1, 'M': 2}, 4,
+ (0, 0, 0, 0, 0, 2, 3, 0, 0, 4, 0, 5, 0, 0, 0, 6, 0, 7, 0, 8, 0, 9, 10, 0, 0, 11, 0, 0, 0, 12, 0, 0,
+  0, 13, 14, 0, 0, 15, 0, 16, 0, 0, 0, 17, 0, 18, 0, 19, 0, 0, 0, 20, 0, 21, 0, 22, 0, 0, 0, 23, 0,
+  0, 0, 24, 0, 25, 0, 0, 0, 26, 0, 0, 0, 0, 0, 27, 0, 28, 0, 29, 0, 30, 31, 0, 0, 0, 0, 32, 0, 33,
+  0, 0, 0, 34, 0, 0, 0, 35, 0, 0, 0, 36, 0, 0, 0, 37, 0, 0, 0, 38, 0, 39, 0, 40, 0, 0, 0, 41, 0, 0,
+  0, 42, 0, 43, 0, 0, 0, 44, 0, 45, 0, 0, 0, 46, 0, 0, 0, 47, 0, 0, 0, 48, 0, 0, 0, 49, 0, 0, 0, 50,
+  0, 0, 0, 51, 0, 0, 0, 52, 0, 0, 0, 53, 0, 0, 0, 54, 0, 0, 0, 0, 0, 55, 0, 56, 0, 0, 0, 57, 0, 0,
+  0, 58, 0, 0, 0, 59, 0, 0, 0, 60, 0, 0, 0, 61, 0, 0, 0, 62, 0, 0, 0, 63, 0, 0, 0, 64, 0, 0, 0, 65,
+  0, 0, 0, 66, 0, 0, 0, 67, 0, 0, 0, 68, 0, 0, 0, 69, 0, 0, 0, 70, 0, 0, 0, 71, 0, 0, 0, 72, 0, 0,
+  0, 73, 0, 0, 0, 74, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 75, 0, 0, 0, 76, 0, 0, 0, 0, 0, 0, 0, 77, 0,
+  0, 0, 78, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 79, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (False, False, False, False, False, False, False, False, False, False, False, False, False, False,
+  False, False, False, False, False, False, False, False, False, False, False, False, False, False,
+  False, False, False, False, False, True, True, False, True, True, False, False, True, False,
+  False, False, False, True, True, True, True, False, False, True, False, False, True, False, True,
+  True, True, False, False, False, True, True, False, True, True, False, True, True, True, False,
+  True, True, True, True, False, True, True, True, True))
+
+MONTH_TABLE = ({65: 4,
+  66: 14,
+  67: 12,
+  68: 8,
+  69: 10,
+  70: 2,
+  71: 17,
+  72: 21,
+  73: 20,
+  74: 1,
+  76: 13,
+  77: 3,
+  78: 7,
+  79: 6,
+  80: 11,
+  82: 15,
+  83: 5,
+  84: 18,
+  85: 9,
+  86: 19,
+  89: 16,
+  97: 4,
+  98: 14,
+  99: 12,
+  100: 8,
+  101: 10,
+  102: 2,
+  103: 17,
+  104: 21,
+  105: 20,
+  106: 1,
+  108: 13,
+  109: 3,
+  110: 7,
+  111: 6,
+  112: 11,
+  114: 15,
+  115: 5,
+  116: 18,
+  117: 9,
+  118: 19,
+  121: 16,
+  'A': 4,
+  'B': 14,
+  'C': 12,
+  'D': 8,
+  'E': 10,
+  'F': 2,
+  'G': 17,
+  'H': 21,
+  'I': 20,
+  'J': 1,
+  'L': 13,
+  'M': 3,
+  'N': 7,
+  'O': 6,
+  'P': 11,
+  'R': 15,
+  'S': 5,
+  'T': 18,
+  'U': 9,
+  'V': 19,
+  'Y': 16,
+  'a': 4,
+  'b': 14,
+  'c': 12,
+  'd': 8,
+  'e': 10,
+  'f': 2,
+  'g': 17,
+  'h': 21,
+  'i': 20,
+  'j': 1,
+  'l': 13,
+  'm': 3,
+  'n': 7,
+  'o': 6,
+  'p': 11,
+  'r': 15,
+  's': 5,
+  't': 18,
+  'u': 9,
+  'v': 19,
+  'y': 16},
+ 22,
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 3, 4, 5, 6, 7, 8, 9, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15, 0, 14, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 20, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21, 0, 0, 0, 0, 0, 22, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 23, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 25, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 27, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 29, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 30, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 31, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 33, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 35, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 36, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 38, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 39, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 41, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 43, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 44, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 45, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 46, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 47, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 49, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 50, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 51, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 52, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 53, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 54, 0, 0, 0, 0, 0, 0, 55,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 57, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 58, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 59, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 60, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 61, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 62, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 66, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 67, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 68, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 69, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (False, False, False, False, False, False, False, False, False, False, False, False, False, False,
+  False, False, False, False, False, False, True, True, True, True, True, True, True, True, True,
+  True, True, True, False, True, True, False, False, False, False, False, False, False, False,
+  False, False, True, True, False, False, False, False, False, False, False, True, False, False,
+  False, False, True, False, False, True, False, False, True, False, True, True, True))
+
+TIME_TABLE = ({32: 3,
+  44: 5,
+  46: 4,
+  48: 1,
+  49: 1,
+  50: 1,
+  51: 1,
+  52: 1,
+  53: 1,
+  54: 1,
+  55: 1,
+  56: 1,
+  57: 1,
+  58: 2,
+  ' ': 3,
+  ',': 5,
+  '.': 4,
+  '0': 1,
+  '1': 1,
+  '2': 1,
+  '3': 1,
+  '4': 1,
+  '5': 1,
+  '6': 1,
+  '7': 1,
+  '8': 1,
+  '9': 1,
+  ':': 2},
+ 6,
+ (0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 3, 4, 0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 6, 0, 0, 0, 0, 0, 7, 0,
+  0, 0, 0, 0, 8, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0, 12, 0, 0, 0,
+  0, 0, 13, 0, 0, 0, 0, 0, 14, 0, 0, 0, 0, 0, 15, 0, 0, 0, 0, 0, 0, 0, 16, 17, 18, 0, 0, 0, 19, 20,
+  21, 0, 0, 0, 0, 0, 0, 0, 22, 0, 0, 0, 0, 0, 23, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 0, 0, 0, 0,
+  0, 25, 0, 0, 0, 0, 0, 26, 0, 0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 28, 0, 0, 0, 0, 0, 29, 0, 0, 0, 0, 0,
+  30, 0, 0, 0, 0, 0, 31, 0, 0, 0, 0, 0, 32, 0, 0, 0, 0, 0, 33, 0, 0, 0, 0, 0, 0, 0, 34, 0, 0, 0, 0,
+  0, 35, 0, 0, 0, 0, 0, 36, 0, 0, 0, 0, 0, 37, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (False, False, False, False, False, False, False, False, False, False, False, False, False, False,
+  True, True, True, False, False, True, False, False, False, False, False, False, False, False,
+  False, False, True, True, True, True, True, True, True, True))
+
+SCANNER_RESET_PATTERN = ('[^0123456789\\\\/\\ \\-\\.,:_\\ '
+ '_\\-T\\+abcdefghijlmnoprstuvyABCDEFGHIJLMNOPRSTUVY]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ '
+ '_\\-TemoEMO])[bB]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ _\\-TeorEOR])[cC]|(?<![0123456789\\\\/\\ '
+ '\\-\\.,:_\\ _\\-TbcdfnstvBCDFNSTV])[eE]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ '
+ '_\\-TuU])[gG]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ _\\-TcC])[hH]|(?<![0123456789\\\\/\\ '
+ '\\-\\.,:_\\ _\\-TrR])[iI]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ '
+ '_\\-TiuIU])[lL]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ _\\-TaeAE])[pP]|(?<![0123456789\\\\/\\ '
+ '\\-\\.,:_\\ _\\-TabepABEP])[rR]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ '
+ '_\\-TcpsCPS])[t]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ _\\-TagjnrAGJNR])[uU]|(?<![0123456789\\\\/\\ '
+ '\\-\\.,:_\\ _\\-ToO])[vV]|(?<![0123456789\\\\/\\ \\-\\.,:_\\ _\\-TalrALR])[yY]')
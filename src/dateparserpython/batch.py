@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from concurrent.futures import Executor, Future
+
+    from .models import LocalDateModel
+    from .parser import Parser, TextInput
+
+DEFAULT_BATCH_SIZE = 256
+EXECUTORS = ("process", "thread")
+# parseSlices does not cut a text into slices shorter than this.
+MIN_SLICE_SIZE = 1 << 16
+
+_worker_parser: Optional["Parser"] = None
+
+
+def iterBatches(texts: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch: List[str] = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _initWorker(parser: "Parser") -> None:
+    # Runs once per worker process; the dictionary tables are built by the
+    # import that unpickling the parser triggers, not per task.
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parseBatch(batch: List[str]) -> List[List["LocalDateModel"]]:
+    assert _worker_parser is not None, "worker parser not initialised"
+    return _parseBatchWith(_worker_parser, batch)
+
+
+def _parseBatchWith(parser: "Parser", batch: List[str]) -> List[List["LocalDateModel"]]:
+    return [parser.parse(text) for text in batch]
+
+
+def _parseSlice(chunk: "TextInput", offset: int) -> List["LocalDateModel"]:
+    assert _worker_parser is not None, "worker parser not initialised"
+    return list(_worker_parser._parseRange(chunk, 0, len(chunk), offset))
+
+
+def _parseSliceWith(parser: "Parser", text: "TextInput", start: int, end: int) -> List["LocalDateModel"]:
+    return list(parser._parseRange(text, start, end, 0))
+
+
+def _createPool(parser: "Parser", workers: int, executor: str) -> Executor:
+    # Imported here: concurrent.futures pulls in multiprocessing, which
+    # would otherwise slow down every import of the package.
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers, initializer=_initWorker, initargs=(parser,))
+
+
+def parseMany(
+    parser: "Parser",
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_BATCH_SIZE,
+    ordered: bool = True,
+    executor: str = "process",
+) -> Iterator[Any]:
+    """
+    Parse every text in ``texts`` on a process or thread pool. Inputs are
+    sent to the workers in batches of ``chunksize`` and at most two batches
+    per worker are in flight, so ``texts`` may be an unbounded iterator.
+
+    Yields one result list per input in input order, or ``(index, results)``
+    pairs in completion order when ``ordered`` is false.
+    """
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be at least 1")
+    if workers == 1:
+        for index, text in enumerate(texts):
+            results = parser.parse(text)
+            yield results if ordered else (index, results)
+        return
+
+    limit = workers * 2
+    with _createPool(parser, workers, executor) as pool:
+        if ordered:
+            queue: Deque[Future] = deque()
+            for batch in iterBatches(texts, chunksize):
+                queue.append(_submit(pool, executor, parser, batch))
+                if len(queue) >= limit:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+            return
+
+        pending: Dict[Future, int] = {}
+        first_index = 0
+        for batch in iterBatches(texts, chunksize):
+            pending[_submit(pool, executor, parser, batch)] = first_index
+            first_index += len(batch)
+            if len(pending) >= limit:
+                yield from _drainCompleted(pending)
+        while pending:
+            yield from _drainCompleted(pending)
+
+
+def parseSlices(
+    parser: "Parser", text: "TextInput", workers: Optional[int] = None, executor: str = "process"
+) -> List["LocalDateModel"]:
+    """
+    Parse one large ``text`` on a process or thread pool. The text is cut
+    into slices at scanner reset positions (see Parser.iterScanSlices),
+    where a sequential scan starts over anyway, so the slices are scanned
+    independently without any overlap to reconcile: joined in slice order,
+    their results are exactly parse(text)'s, with absolute offsets. Texts
+    too short for two slices of MIN_SLICE_SIZE are parsed sequentially.
+
+    Process workers receive a copy of their slice and of the parser; their
+    ParserStats are not merged back into ``parser.stats``.
+    """
+
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be at least 1")
+    text_length = len(text)
+    # A few slices per worker even out slices that are slower to scan.
+    step = max(MIN_SLICE_SIZE, -(-text_length // (workers * 4)))
+    if workers == 1 or text_length < 2 * step:
+        return list(parser.parse_iter(text))
+
+    results: List["LocalDateModel"] = []
+    limit = workers * 2
+    with _createPool(parser, workers, executor) as pool:
+        queue: Deque[Future] = deque()
+        for start, end in parser.iterScanSlices(text, step):
+            if executor == "thread":
+                queue.append(pool.submit(_parseSliceWith, parser, text, start, end))
+            else:
+                chunk = text[start:end]
+                if isinstance(chunk, memoryview):
+                    chunk = chunk.tobytes()
+                queue.append(pool.submit(_parseSlice, chunk, start))
+            if len(queue) >= limit:
+                results.extend(queue.popleft().result())
+        while queue:
+            results.extend(queue.popleft().result())
+    return results
+
+
+def _submit(pool: Executor, executor: str, parser: "Parser", batch: List[str]) -> Future:
+    if executor == "thread":
+        return pool.submit(_parseBatchWith, parser, batch)
+    return pool.submit(_parseBatch, batch)
+
+
+def _drainCompleted(pending: Dict[Future, int]) -> Iterator[Tuple[int, List["LocalDateModel"]]]:
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        first_index = pending.pop(future)
+        for offset, results in enumerate(future.result()):
+            yield first_index + offset, results
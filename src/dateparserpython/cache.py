@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import copy
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .models import LocalDateModel
+except ImportError:  # pragma: no cover - fallback for direct module execution
+    from dateparserpython.models import LocalDateModel
+
+# Approximate footprint of one cached LocalDateModel with its strings.
+RESULT_SIZE_ESTIMATE = 256
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+
+
+class ResultCache:
+    """
+    Thread-safe LRU map from input text to parse results, bounded by entry
+    count and/or an estimate of the memory held (key text plus
+    RESULT_SIZE_ESTIMATE per result). Results are copied on the way in and
+    on the way out, so callers never share models with the cache.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[int, Tuple[LocalDateModel, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, text: str) -> Optional[List[LocalDateModel]]:
+        with self._lock:
+            entry = self._entries.get(text)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(text)
+            self._hits += 1
+        return [copy.copy(localdate) for localdate in entry[1]]
+
+    def put(self, text: str, results: List[LocalDateModel]) -> None:
+        size = sys.getsizeof(text) + RESULT_SIZE_ESTIMATE * len(results)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        stored = tuple(copy.copy(localdate) for localdate in results)
+        with self._lock:
+            previous = self._entries.pop(text, None)
+            if previous is not None:
+                self._size -= previous[0]
+            self._entries[text] = (size, stored)
+            self._size += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, (evicted_size, _) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+                self.max_entries,
+                self.max_bytes,
+            )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get an empty cache with the same limits.
+        return {"max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["max_entries"], state["max_bytes"])  # type: ignore[misc]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .models import LocalDateModel
+
+# NumPy's NaT is the smallest int64 when viewed as datetime64.
+_NAT = -(2**63)
+
+
+def requireNumpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError(
+            "columnar output needs NumPy; install it with `pip install rm-date-parser[numpy]`"
+        ) from exc
+    return numpy
+
+
+@dataclass
+class DateColumns:
+    """
+    Columnar form of parse results. Row ``k`` describes one detected date:
+    ``index[k]`` is the position of its input in the batch (0 for a single
+    text), ``start``/``end`` are its offsets, ``value`` its normalized value
+    as ``datetime64[ms]`` (NaT when it is not a valid calendar date) and
+    ``formats[format_code[k]]`` its identified_date_format.
+    """
+
+    index: Any
+    start: Any
+    end: Any
+    value: Any
+    format_code: Any
+    formats: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+
+def buildColumns(rows: Iterable[Tuple[int, "LocalDateModel"]]) -> DateColumns:
+    np = requireNumpy()
+    index: List[int] = []
+    start: List[int] = []
+    end: List[int] = []
+    values: List[int] = []
+    codes: List[int] = []
+    format_codes: Dict[str, int] = {}
+    for position, localdate in rows:
+        index.append(position)
+        start.append(-1 if localdate.start is None else localdate.start)
+        end.append(-1 if localdate.end is None else localdate.end)
+        epoch_millis = localdate.epoch_millis
+        values.append(_NAT if epoch_millis is None else epoch_millis)
+        found_format = localdate.identified_date_format or ""
+        code = format_codes.get(found_format)
+        if code is None:
+            code = format_codes[found_format] = len(format_codes)
+        codes.append(code)
+    return DateColumns(
+        index=np.array(index, dtype=np.int64),
+        start=np.array(start, dtype=np.int64),
+        end=np.array(end, dtype=np.int64),
+        value=np.array(values, dtype=np.int64).view("datetime64[ms]"),
+        format_code=np.array(codes, dtype=np.int32),
+        formats=list(format_codes),
+    )
+
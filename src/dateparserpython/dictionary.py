@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-from typing import List
+import functools
+import re
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
 
 try:
-    from .display import DisplayObject, TreeChar
-    from .prediction import PredictionModelNode
+    from .prediction import DEAD_STATE, DIGITS, CompiledPredictionModel, PredictionModelNode
 except ImportError:  # pragma: no cover - fallback for direct module execution
-    from dateparserpython.display import DisplayObject, TreeChar
-    from dateparserpython.prediction import PredictionModelNode
+    from dateparserpython.prediction import DEAD_STATE, DIGITS, CompiledPredictionModel, PredictionModelNode
 
-monthPredictionTree = PredictionModelNode()
-weekPredictionTree = PredictionModelNode()
-patternPredictionTree = PredictionModelNode()
-timePredictionTree = PredictionModelNode()
+try:
+    from . import _tables as GeneratedTables
+except ImportError:  # pragma: no cover - direct module execution, or tables not generated
+    GeneratedTables = None
 
 WEEKDAY_FULL: List[str] = [
     "sunday",
@@ -107,6 +107,19 @@ TIME_PATTERN: List[str] = [
 ]
 
 
+DELIMITER_CHARS = "\\/ -.,:_"
+TIME_SEPARATOR_CHARS = " _-T"
+
+# Month names and abbreviations to month numbers.
+MONTH_NUMBERS: Dict[str, int] = {
+    **{month: number for number, month in enumerate(MONTH_FULL, 1)},
+    **{month: number for number, month in enumerate(MONTH_SHORT, 1)},
+}
+# Days in each month of a common year, indexed by month number; index 0 is
+# not a month. Leap years add a day to February (see helper.isLeapYear).
+DAYS_IN_MONTH: Tuple[int, ...] = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 MONTH_LITERAL = 1
 WEEKDAY_LITERAL = 2
 DIGIT_LITERAL = 3
@@ -149,206 +162,6 @@ def getProbables(tree: PredictionModelNode) -> str:
     return pattern
 
 
-def printTree(tree: PredictionModelNode) -> None:
-    tree = sortTree(tree)
-    display_object = displayBuilder(DisplayObject(), tree)
-    print_buffer: List[str] = []
-    line = getBlankLine(display_object.width)
-    prev_level = 0
-    for tc in display_object.displayBuffer:
-        if prev_level == tc.level:
-            line = line[: tc.leftSpace] + tc.symbol + line[tc.leftSpace + len(tc.symbol) :]
-        else:
-            line = line.rstrip() + "\n"
-            print_buffer.append(line)
-            line = getBlankLine(display_object.width)
-            line = line[: tc.leftSpace] + tc.symbol + line[tc.leftSpace + len(tc.symbol) :]
-            prev_level = tc.level
-    print_buffer.append(line)
-    print("".join(print_buffer))
-
-
-def displayBuilder(display: DisplayObject, tree: PredictionModelNode) -> DisplayObject:
-    if isFamilyUnit(tree):
-        return familyDisplayBuilder(tree)
-
-    horizontal_display = DisplayObject()
-    for kid in tree.childern:
-        recursive_display = displayBuilder(horizontal_display, kid)
-        horizontal_display = adjustHorizontalDisplay(horizontal_display, recursive_display)
-
-    horizontal_display.displayBuffer.sort()
-
-    vertical_display = DisplayObject()
-    dad_joints = [0] * tree.children_count()
-
-    j = 0
-    for tc in horizontal_display.displayBuffer:
-        if tc.level > 0 or j >= len(dad_joints):
-            break
-        if tc.symbol not in {"/", "\\", "_", "|"} and tc.symbol.strip():
-            dad_joints[j] = tc.leftSpace
-            j += 1
-
-    if tree.children_count() == 0:
-        return horizontal_display
-    if tree.children_count() == 1:
-        symbol = f"{tree.charcter}{TERMINATION_SYMBOL}" if tree.explict_date_fragment else f"{tree.charcter}"
-        tc = TreeChar(symbol, dad_joints[0], 0)
-        vertical_display.displayBuffer.append(tc)
-    else:
-        dad_joints.sort()
-        symbol = "_"
-        if len(dad_joints) % 2 == 0:
-            papa_position = 1 + (dad_joints[-1] + dad_joints[0]) // 2
-        else:
-            papa_position = dad_joints[len(dad_joints) // 2] + 1
-        papa_position -= 1
-        for k in range(dad_joints[0] + 1, dad_joints[-1] + 1 - 2 + 1):
-            if k == papa_position:
-                s = f"{tree.charcter or '$'}"
-                if tree.explict_date_fragment:
-                    s = f"{s}{TERMINATION_SYMBOL}"
-                tc = TreeChar(s, k, 0)
-            else:
-                tc = TreeChar(symbol, k, 0)
-            vertical_display.displayBuffer.append(tc)
-
-    for joint in dad_joints:
-        for m in range(VERTICAL_PRINT_GAP):
-            vertical_display.displayBuffer.append(TreeChar("|", joint, m + 1))
-
-    display = adjustVerticalDisplay(horizontal_display, vertical_display)
-    return display
-
-
-def adjustVerticalDisplay(horizontal_display: DisplayObject, vertical_display: DisplayObject) -> DisplayObject:
-    if not horizontal_display.displayBuffer:
-        return vertical_display
-    vertical_display.displayBuffer.sort()
-    for tc in horizontal_display.displayBuffer:
-        tc.level += VERTICAL_PRINT_GAP + 1
-        vertical_display.displayBuffer.append(tc)
-    vertical_display.width = horizontal_display.width
-    return vertical_display
-
-
-def adjustHorizontalDisplay(display: DisplayObject, kid_display: DisplayObject) -> DisplayObject:
-    if not display.displayBuffer:
-        return kid_display
-
-    left_pos = display.width
-    for tc in kid_display.displayBuffer:
-        tc.leftSpace += left_pos + HOROZONTAL_PRINT_GAP
-        inserted = False
-        for index, display_tc in enumerate(display.displayBuffer):
-            if display_tc.level <= tc.level:
-                continue
-            display.displayBuffer.insert(max(0, index - 1), tc)
-            inserted = True
-            break
-        if not inserted:
-            display.displayBuffer.append(tc)
-    display.height = max(display.height, kid_display.height)
-    display.width = display.width + kid_display.width + HOROZONTAL_PRINT_GAP
-    return display
-
-
-def familyDisplayBuilder(tree: PredictionModelNode) -> DisplayObject:
-    display_object = DisplayObject()
-    kids = tree.children_count()
-    char_val = f"{tree.charcter}"
-    if tree.explict_date_fragment:
-        char_val = f"{char_val}{TERMINATION_SYMBOL}"
-    if kids == 1:
-        display_object.displayBuffer.append(TreeChar(char_val, 0, 0))
-        display_object.displayBuffer.append(TreeChar("|", 0, 1))
-        kid_char = f"{tree.childern[0].charcter}"
-        display_object.displayBuffer.append(TreeChar(kid_char, 0, 2))
-        display_object.width = 1
-        display_object.height = 3
-    elif kids % 2 == 0:
-        display_object = evenKidCountTree(display_object, tree)
-    else:
-        display_object = oddKidCountTree(display_object, tree)
-    return display_object
-
-
-def evenKidCountTree(display_object: DisplayObject, tree: PredictionModelNode) -> DisplayObject:
-    kids = tree.children_count()
-    papa_position = kids // 2
-    char_val = f"{tree.charcter}"
-    if tree.explict_date_fragment:
-        char_val = f"{char_val}{TERMINATION_SYMBOL}"
-    display_object.displayBuffer.append(TreeChar(char_val, papa_position, 0))
-    display_object.height = papa_position + 2
-    display_object.width = kids + 1
-    for i in range(kids // 2):
-        markers = (i + 1) * 2
-        coeff = 1
-        for j in range(markers):
-            if coeff == markers // 2 + 1:
-                coeff = 1
-            if j < markers // 2:
-                symbol = "|"
-                left_pos = papa_position - coeff
-                coeff += 1
-                if j == markers // 2 - 1:
-                    symbol = "/"
-                display_object.displayBuffer.append(TreeChar(symbol, left_pos, i + 1))
-            else:
-                right_pos = papa_position + coeff
-                coeff += 1
-                symbol = "|"
-                if (j == markers - 1 and i != 0) or markers < 3:
-                    symbol = "\\"
-                display_object.displayBuffer.append(TreeChar(symbol, right_pos, i + 1))
-    for i in range(kids):
-        kid_val = f"{tree.childern[i].charcter}"
-        if i < kids // 2:
-            display_object.displayBuffer.append(TreeChar(kid_val, i, kids // 2 + 1))
-        else:
-            display_object.displayBuffer.append(TreeChar(kid_val, i + 1, kids // 2 + 1))
-    return display_object
-
-
-def oddKidCountTree(display_object: DisplayObject, tree: PredictionModelNode) -> DisplayObject:
-    kids = tree.children_count()
-    papa_position = (kids - 1) // 2
-    char_val = f"{tree.charcter}"
-    if tree.explict_date_fragment:
-        char_val = f"{char_val}{TERMINATION_SYMBOL}"
-    display_object.displayBuffer.append(TreeChar(char_val, papa_position, 0))
-    display_object.height = papa_position + 2
-    display_object.width = kids
-    for i in range((kids - 1) // 2):
-        markers = 2 * i + 3
-        coeff = 1
-        for j in range(markers):
-            if coeff == markers // 2 + 1:
-                coeff = 1
-            if j < markers // 2:
-                symbol = "|"
-                left_pos = papa_position - coeff
-                coeff += 1
-                if j == markers // 2 - 1 and markers > 2:
-                    symbol = "/"
-                display_object.displayBuffer.append(TreeChar(symbol, left_pos, i + 1))
-            elif j == markers // 2:
-                display_object.displayBuffer.append(TreeChar("|", papa_position, i + 1))
-            else:
-                right_pos = papa_position + coeff
-                coeff += 1
-                symbol = "|"
-                if j == markers - 1 and markers > 2:
-                    symbol = "\\"
-                display_object.displayBuffer.append(TreeChar(symbol, right_pos, i + 1))
-    for i in range(kids):
-        kid_val = f"{tree.childern[i].charcter}"
-        display_object.displayBuffer.append(TreeChar(kid_val, i, kids // 2 + 1))
-    return display_object
-
-
 def getMaxTreeHeight(tree: PredictionModelNode) -> int:
     if tree.has_childern():
         heights = [getMaxTreeHeight(child) for child in tree.childern]
@@ -380,13 +193,6 @@ def isFamilyUnit(tree: PredictionModelNode) -> bool:
     return True
 
 
-def getBlankLine(length: int) -> str:
-    result = " "
-    for _ in range(length):
-        result = f" {result}"
-    return result
-
-
 def getRegexPattern(tree_elements: List[str]) -> str:
     tree = PredictionModelNode()
     buildTree(tree_elements, tree)
@@ -428,22 +234,235 @@ def getFamilyUnitPattern(tree: PredictionModelNode) -> str:
     return "".join(buffer)
 
 
-def _initialize_trees() -> None:
-    monthPredictionTree.level = 0
-    monthPredictionTree.charcter = "0"
-    patternPredictionTree.level = 0
-    patternPredictionTree.charcter = "0"
-    timePredictionTree.level = 0
-    timePredictionTree.charcter = "0"
-    weekPredictionTree.level = 0
-    weekPredictionTree.charcter = "0"
-
-    buildTree(MONTH_FULL, monthPredictionTree)
-    buildTree(MONTH_SHORT, monthPredictionTree)
-    buildTree(WEEKDAY_FULL, weekPredictionTree)
-    buildTree(WEEKDAY_SHORT, weekPredictionTree)
-    buildTree(PATTERN, patternPredictionTree)
-    buildTree(TIME_PATTERN, timePredictionTree)
+def buildScannerResetPattern() -> Pattern[str]:
+    """
+    Regex matching single characters at which Parser.getDateGroups is
+    guaranteed to drop whatever it was tracking and return to its initial
+    state. That holds for characters that can never take part in a date (not
+    a digit, delimiter, time separator or month letter), and for letters that
+    cannot start a month name and cannot follow the preceding letter in any
+    month name. "+" is not one of them: Parser._scanIso reads UTC offsets
+    such as "+05:30" past it.
+    """
+
+    structural = "0123456789" + DELIMITER_CHARS + TIME_SEPARATOR_CHARS
+    months = MONTH_FULL + MONTH_SHORT
+    letters = sorted({char for month in months for char in month})
+    first_letters = {month[0] for month in months}
+    predecessors: Dict[str, Set[str]] = {char: set() for char in letters}
+    for month in months:
+        for prev, char in zip(month, month[1:]):
+            predecessors[char].add(prev)
+
+    live = re.escape(structural + "+" + "".join(letters) + "".join(letters).upper())
+    resets = [f"[^{live}]"]
+    for char in letters:
+        if char in first_letters:
+            continue
+        allowed = "".join(sorted(predecessors[char]))
+        blocked = re.escape(structural + allowed + allowed.upper())
+        variants = char if char.upper() in structural else char + char.upper()
+        resets.append(f"(?<![{blocked}])[{variants}]")
+    return re.compile("|".join(resets))
+
+
+# Bump whenever CompiledPredictionModel.from_tree or buildScannerResetPattern
+# changes what they produce, so stale generated tables are not used.
+TABLES_VERSION = 3
+# Trees built on first access, with the word lists each is built from.
+_TREE_SOURCES: Dict[str, Tuple[List[str], ...]] = {
+    "monthPredictionTree": (MONTH_FULL, MONTH_SHORT),
+    "weekPredictionTree": (WEEKDAY_FULL, WEEKDAY_SHORT),
+    "patternPredictionTree": (PATTERN,),
+    "timePredictionTree": (TIME_PATTERN,),
+}
+# Tree printing lives in display.py and is only imported when asked for.
+_DISPLAY_NAMES = frozenset(
+    {
+        "DisplayObject",
+        "TreeChar",
+        "printTree",
+        "displayBuilder",
+        "adjustVerticalDisplay",
+        "adjustHorizontalDisplay",
+        "familyDisplayBuilder",
+        "evenKidCountTree",
+        "oddKidCountTree",
+        "getBlankLine",
+    }
+)
+
+
+def buildPredictionTree(*item_lists: List[str]) -> PredictionModelNode:
+    tree = PredictionModelNode()
+    tree.level = 0
+    tree.charcter = "0"
+    for item_list in item_lists:
+        buildTree(item_list, tree)
+    return tree
 
 
-_initialize_trees()
+def tableSource() -> Tuple[Any, ...]:
+    """Everything the compiled tables are derived from."""
+
+    return (
+        TABLES_VERSION,
+        tuple(MONTH_FULL),
+        tuple(MONTH_SHORT),
+        tuple(PATTERN),
+        tuple(TIME_PATTERN),
+        DELIMITER_CHARS,
+        TIME_SEPARATOR_CHARS,
+    )
+
+
+def compileTables() -> Dict[str, Any]:
+    """
+    Build the tables Parser.getDateGroups walks, as plain data: one
+    ``(classes, width, transitions, accepting)`` tuple per prediction table
+    and the source of the scanner reset pattern.
+    """
+
+    def flatten(table: CompiledPredictionModel) -> Tuple[Any, ...]:
+        return (table.classes, table.width, table.transitions, table.accepting)
+
+    return {
+        "PATTERN_TABLE": flatten(CompiledPredictionModel.from_tree(buildPredictionTree(PATTERN))),
+        "MONTH_TABLE": flatten(
+            CompiledPredictionModel.from_tree(buildPredictionTree(MONTH_FULL, MONTH_SHORT), fold_case=True)
+        ),
+        "TIME_TABLE": flatten(
+            CompiledPredictionModel.from_tree(
+                buildPredictionTree(TIME_PATTERN), digit_symbol="D", fold_case=True
+            )
+        ),
+        "SCANNER_RESET_PATTERN": buildScannerResetPattern().pattern,
+    }
+
+
+def writeTables(path: Optional[str] = None) -> str:
+    """
+    Regenerate _tables.py (or ``path``), the precompiled form of
+    compileTables() that import loads instead of building the tries. Run
+    after editing the word lists above; until then they are rebuilt at
+    import. Returns the path written.
+    """
+
+    import os
+    import pprint
+
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_tables.py")
+    lines = [
+        "# Generated by dateparserpython.dictionary.writeTables(); do not edit.",
+        "",
+        f"SOURCE = {pprint.pformat(tableSource(), width=100, compact=True)}",
+        "",
+    ]
+    for name, value in compileTables().items():
+        lines.append(f"{name} = {pprint.pformat(value, width=100, compact=True)}")
+        lines.append("")
+    with open(path, "w", encoding="utf-8", newline="\n") as handle:
+        handle.write("\n".join(lines))
+    return path
+
+
+def _loadTables() -> Dict[str, Any]:
+    # The generated module is unmarshalled from its .pyc like any other
+    # module, which is far cheaper than building the tries; it is only
+    # trusted while it was generated from the current word lists.
+    if GeneratedTables is not None and getattr(GeneratedTables, "SOURCE", None) == tableSource():
+        return vars(GeneratedTables)
+    return compileTables()
+
+
+def __getattr__(name: str) -> Any:
+    if name in _TREE_SOURCES:
+        value = buildPredictionTree(*_TREE_SOURCES[name])
+    elif name == "scannerResetPattern":
+        value = re.compile(_tables["SCANNER_RESET_PATTERN"])
+    elif name == "scannerResetBytesPattern":
+        # The same positions in byte input; bytes above 127 reset like the
+        # non-ASCII characters they encode.
+        value = re.compile(_tables["SCANNER_RESET_PATTERN"].encode("ascii"))
+    elif name in _DISPLAY_NAMES:
+        try:
+            from . import display as Display
+        except ImportError:  # pragma: no cover - fallback for direct module execution
+            from dateparserpython import display as Display
+        return getattr(Display, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+_tables = _loadTables()
+
+# Table-driven forms of the tries walked by Parser.getDateGroups. Pattern
+# tables consume the scanner markers ("D", "*", "M"); month and time tables
+# consume raw characters, folding case and (for time) digits onto "D".
+# monthPredictionTree and the other tries, scannerResetPattern (and
+# scannerResetBytesPattern) and the tree printing helpers are created on
+# first access (see __getattr__).
+patternPredictionTable = CompiledPredictionModel(*_tables["PATTERN_TABLE"])
+monthPredictionTable = CompiledPredictionModel(*_tables["MONTH_TABLE"])
+timePredictionTable = CompiledPredictionModel(*_tables["TIME_TABLE"])
+
+# A pattern must read as three digit runs or month names separated by
+# delimiters, the only shape Parser.interpretDateFragment understands.
+_PATTERN_SHAPE = re.compile(r"(?:D+|M)\*+(?:D+|M)\*+(?:D+|M)")
+# Time patterns may only use characters that never reset the scanner, so
+# reset positions stay valid for every profile.
+_TIME_PATTERN_CHARS = frozenset("D" + DELIMITER_CHARS + TIME_SEPARATOR_CHARS)
+# Stands in for a table with no entries: every character, digits included,
+# leads to DEAD_STATE.
+_EMPTY_TABLE = CompiledPredictionModel(
+    {**dict.fromkeys(DIGITS, 0), **dict.fromkeys(DIGITS.encode(), 0)}, 1, (DEAD_STATE, DEAD_STATE), (False, False)
+)
+
+
+def checkPatterns(patterns: Tuple[str, ...], time_patterns: Tuple[str, ...]) -> None:
+    """Raise ValueError unless every pattern has a shape the scanner supports."""
+
+    for pattern in patterns:
+        if "D" not in pattern or not _PATTERN_SHAPE.fullmatch(pattern):
+            raise ValueError(
+                f"date pattern {pattern!r} must be three D runs or M separated by '*' runs, "
+                f"with at least one D, like {PATTERN[0]!r}"
+            )
+    for pattern in time_patterns:
+        if not pattern.startswith("D") or not _TIME_PATTERN_CHARS.issuperset(pattern):
+            raise ValueError(
+                f"time pattern {pattern!r} must start with D and otherwise only contain delimiters, "
+                f"like {TIME_PATTERN[0]!r}"
+            )
+
+
+@functools.lru_cache(maxsize=64)
+def compileProfile(
+    patterns: Tuple[str, ...], time_patterns: Tuple[str, ...]
+) -> Tuple[CompiledPredictionModel, CompiledPredictionModel, CompiledPredictionModel]:
+    """
+    Return the ``(pattern, month, time)`` tables for a Parser limited to
+    ``patterns`` and ``time_patterns``. Tables that match the defaults are
+    the shared module tables; the rest are compiled for the profile, with
+    the month table left empty when no pattern has an M. The module lists
+    are never modified.
+    """
+
+    checkPatterns(patterns, time_patterns)
+    if patterns == tuple(PATTERN):
+        pattern_table = patternPredictionTable
+    else:
+        pattern_table = CompiledPredictionModel.from_tree(buildPredictionTree(list(patterns)))
+    month_table = monthPredictionTable if any("M" in pattern for pattern in patterns) else _EMPTY_TABLE
+    if not time_patterns:
+        time_table = _EMPTY_TABLE
+    elif time_patterns == tuple(TIME_PATTERN):
+        time_table = timePredictionTable
+    else:
+        time_table = CompiledPredictionModel.from_tree(
+            buildPredictionTree(list(time_patterns)), digit_symbol="D", fold_case=True
+        )
+    return pattern_table, month_table, time_table
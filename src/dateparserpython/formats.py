@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import re
+import sys
+from typing import Dict, Tuple
+
+try:
+    from . import helper as Helper
+except ImportError:  # pragma: no cover - fallback for direct module execution
+    from dateparserpython import helper as Helper
+
+_ALPHANUMERIC = re.compile(r"[A-Za-z0-9]")
+
+# (interpreted format, time suffix, delimiters, full month, AM/PM) -> final
+# identified_date_format. Every part of the key comes from the finite set of
+# patterns, delimiters and time formats in the dictionary, so the table stays
+# small; it is filled on first use of each combination.
+_FORMATS: Dict[Tuple[str, str, str, bool, bool], str] = {}
+
+
+def fragmentFacts(date_fragment: str, data: str, is_alphanumeric: bool) -> Tuple[str, bool]:
+    """
+    Return what identifiedFormat needs to know about a match: the delimiters
+    of its ``date_fragment`` (empty unless there are two or three, the only
+    counts that are filled in) and whether ``data`` spells a month out in
+    full.
+    """
+
+    delims = _ALPHANUMERIC.sub("", date_fragment)
+    if len(delims) not in (2, 3):
+        delims = ""
+    return sys.intern(delims), is_alphanumeric and Helper.isFullMonth(data)
+
+
+def identifiedFormat(
+    found_format: str, time_suffix: str, delims: str, full_month: bool, has_am_pm: bool
+) -> str:
+    """
+    Return the final identified_date_format for a match: ``delims``, full
+    month names and the AM/PM marker filled into ``found_format`` (the format
+    interpretation produced) followed by ``time_suffix``. ``delims`` and
+    ``full_month`` are the values returned by fragmentFacts.
+    """
+
+    key = (found_format, time_suffix, delims, full_month, has_am_pm)
+    value = _FORMATS.get(key)
+    if value is None:
+        value = _FORMATS.setdefault(key, _deriveFormat(*key))
+    return value
+
+
+def _deriveFormat(found_format: str, time_suffix: str, delims: str, full_month: bool, has_am_pm: bool) -> str:
+    found_format = f"{found_format}{time_suffix}"
+    if len(delims) == 2:
+        found_format = found_format.replace("$", delims[0])
+        found_format = found_format.replace("&", delims[1])
+    if len(delims) == 3:
+        found_format = found_format.replace("$", delims[0])
+        found_format = found_format.replace("&", delims[1] + delims[2])
+    if full_month:
+        found_format = found_format.replace("MMM", "MMMMM")
+    if has_am_pm:
+        found_format = f"{found_format} a"
+    # Interned so every result shares one string per format.
+    return sys.intern(found_format)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import random
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
 
 try:
     from . import dictionary as Dictionary
 except ImportError:  # pragma: no cover - fallback for direct module execution
     from dateparserpython import dictionary as Dictionary
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import random
+
 
 def isDateLieral(token: str) -> int:
     """
@@ -70,21 +72,27 @@ def isDigit(value) -> bool:
 
 
 def isDelimeter(c: str) -> bool:
-    return c in "\\/ -.,:_"
+    return c in Dictionary.DELIMITER_CHARS
 
 
 def isTimeSeprator(c: str) -> bool:
-    return c in " _-T"
+    return c in Dictionary.TIME_SEPARATOR_CHARS
+
 
+def testDataForDateFormats(rng: Optional[random.Random] = None) -> List[str]:
+    """
+    Build one sample string per entry of Dictionary.PATTERN plus every
+    PATTERN x TIME_PATTERN combination. Pass a seeded ``rng`` to make the
+    samples reproducible.
+    """
 
-def testDataForDateFormats() -> List[str]:
     date_patterns = []
     for pattern in Dictionary.PATTERN:
-        test_data = "".join(getTestDataForChar(char) for char in pattern)
+        test_data = "".join(getTestDataForChar(char, rng) for char in pattern)
         date_patterns.append(test_data)
     time_patterns = []
     for pattern in Dictionary.TIME_PATTERN:
-        test_data = "".join(getTestDataForChar(char) for char in pattern)
+        test_data = "".join(getTestDataForChar(char, rng) for char in pattern)
         time_patterns.append(test_data)
     combined = []
     for date_fragment in date_patterns:
@@ -94,13 +102,18 @@ def testDataForDateFormats() -> List[str]:
     return date_patterns
 
 
-def getTestDataForChar(c: str) -> str:
+def getTestDataForChar(c: str, rng: Optional[random.Random] = None) -> str:
+    if rng is None:
+        # Only the test-data helpers need random, so the import waits for them.
+        import random
+
+        rng = random  # type: ignore[assignment]
     if c == "D":
-        return str(random.randint(0, 9))
+        return str(rng.randint(0, 9))
     if c == "*":
-        return getTestCaseDelimeter(random.randint(1, 6))
+        return getTestCaseDelimeter(rng.randint(1, 6))
     if c == "M":
-        return getTestMonth(random.randint(1, 24))
+        return getTestMonth(rng.randint(1, 24))
     return c
 
 
@@ -151,19 +164,40 @@ def isFullMonth(s: str) -> bool:
     return any(month in s for month in Dictionary.MONTH_FULL)
 
 
+def isLeapYear(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
 def getDaysinMonth(month: int, year: int) -> int:
-    if month > 12:
+    """Number of days in ``month`` of ``year``, or -1 if ``month`` is not 1-12."""
+
+    if not 0 < month < 13:
         return -1
-    if month == 2:
-        if month % 4 == 0:
-            return 29
-        return 28
-    if month == 8:
-        return 31
-    if month < 8 and month % 2 == 1:
-        return 31
-    if month < 8 and month % 2 == 0:
-        return 30
-    if month % 2 == 1:
-        return 30
-    return 31
+    if month == 2 and isLeapYear(year):
+        return 29
+    return Dictionary.DAYS_IN_MONTH[month]
+
+
+def isValidDate(year: int, month: int, day: int) -> bool:
+    return 0 < day <= getDaysinMonth(month, year)
+
+
+def areValidDates(dates: Iterable[Sequence[int]]) -> List[bool]:
+    """
+    Check many ``(year, month, day)`` triples at once and return one bool
+    per triple, as isValidDate would. ``dates`` can also be an ``(n, 3)``
+    array. The check is vectorized with NumPy when it is installed.
+    """
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - depends on the environment
+        return [isValidDate(*date) for date in dates]
+    if not isinstance(dates, numpy.ndarray):
+        dates = list(dates)
+    years, months, days = numpy.asarray(dates, dtype=numpy.int64).reshape(-1, 3).T
+    known = (months > 0) & (months < 13)
+    limits = numpy.asarray(Dictionary.DAYS_IN_MONTH)[numpy.where(known, months, 0)]
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    limits = limits + ((months == 2) & leap)
+    return ((days > 0) & (days <= limits)).tolist()
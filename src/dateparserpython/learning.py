@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Pattern
+
+try:
+    from . import dictionary as Dictionary
+except ImportError:  # pragma: no cover - fallback for direct module execution
+    from dateparserpython import dictionary as Dictionary
+
+_SHAPE_RUN = re.compile(r"[0-9]+|[a-z]+| +|.", re.DOTALL)
+
+
+@dataclass
+class LearningState:
+    """
+    Per-Parser bookkeeping for learnPattern; see Parser._parseLearned.
+    ``lock`` guards it when the Parser is shared between threads.
+    """
+
+    candidate_format: Optional[str] = None
+    candidate_sample: Optional[str] = None
+    candidate_shape: Optional[str] = None
+    streak: int = 0
+    matcher: Optional[Pattern[str]] = None
+    attempts: int = 0
+    misses: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get a copy of the state with a lock of their own.
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def reset(self) -> None:
+        self.candidate_format = None
+        self.candidate_sample = None
+        self.candidate_shape = None
+        self.streak = 0
+        self.matcher = None
+        self.attempts = 0
+        self.misses = 0
+
+
+def buildShapePattern(sample: str, found_format: str) -> str:
+    """
+    Turn the original_text of a detected date into a regex source matching
+    text of the same shape: digit runs of similar width, any month name in
+    the same (short or full) style, either AM or PM, and the same
+    delimiters (including the "T" and "Z" of ISO-8601 timestamps). The
+    pattern only locates candidates; the scanner still decides what they
+    mean.
+    """
+
+    if "MMMMM" in found_format:
+        months = Dictionary.MONTH_FULL
+    else:
+        months = Dictionary.MONTH_SHORT
+    month_pattern = "(?i:" + "|".join(sorted(set(months), key=len, reverse=True)) + ")"
+    pieces = []
+    for run in _SHAPE_RUN.findall(sample.lower()):
+        if run.isdigit():
+            pieces.append(f"[0-9]{{{len(run)}}}" if len(run) > 2 else "[0-9]{1,2}")
+        elif run in ("am", "pm"):
+            pieces.append("[aApP][mM]")
+        elif run in ("t", "z"):
+            # The ISO-8601 time separator and UTC marker, always upper case.
+            pieces.append(run.upper())
+        elif run.isalpha():
+            pieces.append(month_pattern)
+        elif run.startswith(" "):
+            pieces.append(" +")
+        else:
+            pieces.append(re.escape(run))
+    return "".join(pieces)
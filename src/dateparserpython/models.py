@@ -1,17 +1,173 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import datetime
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
+try:
+    from . import formats as Formats
+except ImportError:  # pragma: no cover - fallback for direct module execution
+    from dateparserpython import formats as Formats
+
+# Results are kept around in large numbers, so the models drop their per-
+# instance __dict__ (for the dataclasses, where supported: Python 3.10+).
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=datetime.timezone.utc)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+
+class DateComponents(NamedTuple):
+    """
+    The values behind a date_time_string, as the parser read them. The
+    fields mirror the datetime constructor; date-only results are midnight.
+    ``tzinfo`` is only set when the text gave a UTC offset after the time.
+    """
+
+    year: int
+    month: int
+    day: int
+    hour: int = 0
+    minute: int = 0
+    second: int = 0
+    microsecond: int = 0
+    tzinfo: Optional[datetime.tzinfo] = None
+
+
+def _dateTimeString(match: Tuple[Any, ...]) -> Optional[str]:
+    date, time = match[1:]
+    value = date[0]
+    if time is not None and time[1] is not None:
+        value = f"{value} {time[1]}"
+    return value
+
+
+def _conDateFormat(match: Tuple[Any, ...]) -> Optional[str]:
+    date, time = match[1:]
+    return date[1] if time is None else sys.intern(f"{date[1]} {time[0]}")
+
+
+def _identifiedDateFormat(match: Tuple[Any, ...]) -> Optional[str]:
+    has_am_pm, date, time = match
+    return Formats.identifiedFormat(date[2] or "", "" if time is None else time[2], date[4], date[5], has_am_pm)
+
+
+def _components(match: Tuple[Any, ...]) -> Optional[DateComponents]:
+    date, time = match[1:]
+    value = date[3]
+    if time is not None and value is not None:
+        value = DateComponents(value[0], value[1], value[2], *time[3])
+    return value
+
+
+# The LocalDateModel fields a lazy result derives from its match.
+_DERIVED: Dict[str, Callable[[Tuple[Any, ...]], Any]] = {
+    "date_time_string": _dateTimeString,
+    "con_date_format": _conDateFormat,
+    "identified_date_format": _identifiedDateFormat,
+    "components": _components,
+}
+
+
+class _LazyFields:
+    # Holds the match of a result built by LocalDateModel.fromMatch, whose
+    # derived fields are left unset until they are first read.
+    __slots__ = ("_match",)
+
+    def __getattr__(self, name: str) -> Any:
+        derive = _DERIVED.get(name)
+        if derive is None:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+        value = derive(object.__getattribute__(self, "_match"))
+        object.__setattr__(self, name, value)
+        return value
+
+
+@dataclass(**_SLOTS)
+class LocalDateModel(_LazyFields):
+    """
+    One date found in the text. Results built with fromMatch keep the facts
+    of the match they came from and derive date_time_string,
+    con_date_format, identified_date_format and components the first time
+    each is read, so callers that only look at ``start``/``end`` never pay
+    for them. Otherwise it is a plain dataclass: fields can be assigned as
+    usual and asdict, replace, comparisons, copies and pickles see the
+    derived values.
+    """
 
-@dataclass
-class LocalDateModel:
     original_text: Optional[str] = None
     date_time_string: Optional[str] = None
     con_date_format: Optional[str] = None
     identified_date_format: Optional[str] = None
     start: Optional[int] = None
     end: Optional[int] = None
+    components: Optional[DateComponents] = None
+
+    @classmethod
+    def fromMatch(
+        cls, element: "DateElement", date: Tuple[Any, ...], time: Optional[Tuple[Any, ...]] = None
+    ) -> "LocalDateModel":
+        """
+        Build a lazy result for ``element`` from the tuples returned by
+        Parser.interpretDateFragment and, when its time fragment is valid,
+        Parser.interpretTimeFragment.
+        """
+
+        localdate = cls.__new__(cls)
+        localdate.original_text = element.data
+        localdate.start = element.startPos
+        localdate.end = element.endPos
+        # ``date`` carries the fragment facts identified_date_format needs;
+        # AM/PM is the only one kept from the element.
+        localdate._match = (element.hasAmPm, date, time)
+        return localdate
+
+    @property
+    def datetime(self) -> Optional[datetime.datetime]:
+        """
+        The datetime for ``components``, or None when there are none or they
+        do not form a real calendar date (the scanner accepts day 00, for
+        example). It is naive unless the text gave a UTC offset.
+        """
+
+        components = self.components
+        if components is None:
+            return None
+        try:
+            return datetime.datetime(*components)
+        except ValueError:
+            return None
+
+    @property
+    def epoch_millis(self) -> Optional[int]:
+        """
+        Milliseconds since 1970-01-01T00:00 UTC. A naive datetime is read as
+        UTC; one with a UTC offset is converted.
+        """
+
+        value = self.datetime
+        if value is None:
+            return None
+        return (value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MILLISECOND
+
+    def __copy__(self) -> "LocalDateModel":
+        # Copies share the match and whatever was derived from it so far.
+        duplicate = self.__class__.__new__(self.__class__)
+        for name in _COPIED:
+            try:
+                object.__setattr__(duplicate, name, object.__getattribute__(self, name))
+            except AttributeError:
+                pass
+        return duplicate
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in _FIELDS)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(_FIELDS, state):
+            object.__setattr__(self, name, value)
 
     def __str__(self) -> str:
         return (
@@ -24,7 +180,17 @@ class LocalDateModel:
         )
 
 
-@dataclass
+_FIELDS = tuple(field.name for field in fields(LocalDateModel))
+_COPIED = ("_match",) + _FIELDS
+if not _SLOTS:
+    # Without slots the field defaults stay class attributes, which would
+    # hide unset fields from __getattr__; __init__ keeps its own copies.
+    for _name in _DERIVED:
+        delattr(LocalDateModel, _name)
+    del _name
+
+
+@dataclass(**_SLOTS)
 class DateElement:
     data: str
     tokenNum: int = 0
@@ -37,6 +203,9 @@ class DateElement:
     timeFragment: Optional[str] = None
     dateFragment: Optional[str] = None
     dateTimeSeprator: str = " "
+    # UTC offset ("Z", "+05:30") read after an ISO-8601 time; it is also
+    # the end of ``data``.
+    zoneFragment: Optional[str] = None
 
     def getDateFragment(self) -> str:
         if self.timeFragment is None:
@@ -50,6 +219,6 @@ class DateElement:
             f"isAlphaNumeric={self.isAlphaNumeric}, aphaNumericType={self.aphaNumericType}, "
             f"startPos={self.startPos}, endPos={self.endPos}, hasAmPm={self.hasAmPm}, "
             f"timeFragment={self.timeFragment}, dateFragment={self.dateFragment}, "
-            f"dateTimeSeprator={self.dateTimeSeprator})"
+            f"dateTimeSeprator={self.dateTimeSeprator}, zoneFragment={self.zoneFragment})"
         )
 
@@ -1,16 +1,116 @@
 from __future__ import annotations
 
+import codecs
+import datetime
+import functools
+import itertools
+import os
 import re
-from typing import Iterable, List, Optional
+import sys
+import weakref
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Pattern, TextIO, Tuple, Union
 
 try:
+    from . import batch as Batch
+    from . import columns as Columns
     from . import dictionary as Dictionary
+    from . import formats as Formats
     from . import helper as Helper
-    from .models import DateElement, LocalDateModel
+    from . import learning as Learning
+    from .cache import CacheInfo, ResultCache
+    from .models import DateComponents, DateElement, LocalDateModel
+    from .prediction import DEAD_STATE, ROOT_STATE
+    from .stats import STAGES, ParserStats
 except ImportError:  # pragma: no cover - fallback for direct module execution
+    from dateparserpython import batch as Batch
+    from dateparserpython import columns as Columns
     from dateparserpython import dictionary as Dictionary
+    from dateparserpython import formats as Formats
     from dateparserpython import helper as Helper
-    from dateparserpython.models import DateElement, LocalDateModel
+    from dateparserpython import learning as Learning
+    from dateparserpython.cache import CacheInfo, ResultCache
+    from dateparserpython.models import DateComponents, DateElement, LocalDateModel
+    from dateparserpython.prediction import DEAD_STATE, ROOT_STATE
+    from dateparserpython.stats import STAGES, ParserStats
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    # asyncio and concurrent.futures take most of the package import time,
+    # so the methods that need them import them on first use.
+    import asyncio
+    from concurrent.futures import Executor
+
+# parse and parse_iter also take bytes-like input; offsets are then byte
+# offsets.
+TextInput = Union[str, bytes, bytearray, memoryview]
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+_DIGIT_PATTERN = re.compile(r"[0-9]")
+_DIGIT_BYTES_PATTERN = re.compile(rb"[0-9]")
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_ASYNC_STEP = 1 << 14
+DEFAULT_FRAGMENT_CACHE_SIZE = 4096
+# The scanner keeps month names in lower case. "T" is read as a date/time
+# separator rather than a letter and keeps its case.
+_MONTH_CASE_FOLD = str.maketrans("ABCDEFGHIJKLMNOPQRSUVWXYZ", "abcdefghijklmnopqrsuvwxyz")
+_SPACE_RUN = re.compile(" {2,}")
+
+
+# What the scanner reads each character as: "D" for digits, "*" for
+# delimiters and date/time separators; anything else is a letter candidate.
+# Keys are both characters and byte values, so str and bytes input share it.
+_CHAR_MARKERS: Dict[Any, str] = {}
+for _char in Dictionary.DELIMITER_CHARS + Dictionary.TIME_SEPARATOR_CHARS:
+    _CHAR_MARKERS[_char] = _CHAR_MARKERS[ord(_char)] = "*"
+for _char in "0123456789":
+    _CHAR_MARKERS[_char] = _CHAR_MARKERS[ord(_char)] = "D"
+del _char
+_TIME_SEPARATORS = frozenset(Dictionary.TIME_SEPARATOR_CHARS) | frozenset(Dictionary.TIME_SEPARATOR_CHARS.encode())
+# The canonical ISO-8601 forms Parser._scanIso reads without the general
+# scanner: a date, optionally followed by " " or "T", a time with an optional
+# three digit fraction and an optional "Z" or "+hh:mm" UTC offset (group 2).
+_ISO_SOURCE = (
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"(?:[ T][0-9]{2}:[0-9]{2}:[0-9]{2}([.,][0-9]{3})?(Z|[+-](?:[01][0-9]|2[0-3]):[0-5][0-9])?)?"
+)
+_ISO_PATTERN = re.compile(_ISO_SOURCE)
+_ISO_BYTES_PATTERN = re.compile(_ISO_SOURCE.encode())
+
+
+def _collapseSpaces(text: str) -> str:
+    # The scanner skips every space that follows another one.
+    return _SPACE_RUN.sub(" ", text) if "  " in text else text
+
+
+def _asText(part: TextInput) -> str:
+    # Every character a fragment can hold is ASCII, so Latin-1 maps bytes to
+    # the same characters one to one.
+    return part if part.__class__ is str else str(part, "latin-1")  # type: ignore[arg-type]
+
+
+def _resetPattern(text: TextInput) -> Pattern[Any]:
+    return Dictionary.scannerResetPattern if isinstance(text, str) else Dictionary.scannerResetBytesPattern
+
+
+@functools.lru_cache(maxsize=None)
+def _timeZone(zone: str) -> Tuple[str, datetime.timezone]:
+    # identified_date_format suffix and tzinfo for a UTC offset found after
+    # an ISO-8601 time ("Z" or "+05:30").
+    if zone == "Z":
+        return "XXX", datetime.timezone.utc
+    offset = datetime.timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6]))
+    return "XXX", datetime.timezone(-offset if zone[0] == "-" else offset)
+
+
+def _withZone(time: Tuple[Any, ...], zone: str) -> Tuple[Any, ...]:
+    suffix, tzinfo = _timeZone(zone)
+    return time[0], time[1], f"{time[2]}{suffix}", (*time[3], tzinfo)
+
+
+def _byteView(text: TextInput) -> TextInput:
+    # Indexing must yield byte values, which needs a flat unsigned view.
+    if isinstance(text, memoryview) and (text.format != "B" or text.ndim != 1):
+        return text.cast("B")
+    return text
 
 
 class Parser:
@@ -19,54 +119,524 @@ class Parser:
     version: call parse(text) to receive a list of LocalDateModel instances.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        prefilter: bool = False,
+        cache_size: Optional[int] = None,
+        cache_bytes: Optional[int] = None,
+        fragment_cache_size: int = DEFAULT_FRAGMENT_CACHE_SIZE,
+        learn_pattern: bool = False,
+        learn_after: int = 20,
+        relearn_miss_rate: float = 0.2,
+        relearn_window: int = 200,
+        learned_only: bool = False,
+        collect_stats: bool = False,
+        date_strings: bool = True,
+        patterns: Optional[Iterable[str]] = None,
+        time_patterns: Optional[Iterable[str]] = None,
+        months: bool = True,
+        times: bool = True,
+    ) -> None:
         self.delim = "-.\\/|:, "
+        self.prefilter = prefilter
+        self._result_cache: Optional[ResultCache] = None
+        if cache_size or cache_bytes:
+            self._result_cache = ResultCache(cache_size, cache_bytes)
         self.learnedPatternString: Optional[str] = None
-        self.learnPattern = False
-        self._tokenizer_cache: dict[str, re.Pattern[str]] = {}
+        self.learnPattern = learn_pattern
+        self.learn_after = learn_after
+        self.relearn_miss_rate = relearn_miss_rate
+        self.relearn_window = relearn_window
+        self.learned_only = learned_only
+        self._learning = Learning.LearningState()
+        self.date_strings = date_strings
+        self.patterns = tuple(Dictionary.PATTERN if patterns is None else patterns)
+        if not months:
+            self.patterns = tuple(pattern for pattern in self.patterns if "M" not in pattern)
+        if not self.patterns:
+            raise ValueError("at least one date pattern is required")
+        self.time_patterns: Tuple[str, ...] = ()
+        if times:
+            self.time_patterns = tuple(Dictionary.TIME_PATTERN if time_patterns is None else time_patterns)
+        self.months = months
+        self.times = times
+        self._initTables()
+        self.fragment_cache_size = fragment_cache_size
+        self._initFragmentCaches()
+        self.stats: Optional[ParserStats] = ParserStats() if collect_stats else None
+        self._tokenizer_cache: Dict[str, re.Pattern[str]] = {
+            delimiters: self._compileTokenizer(delimiters) for delimiters in (self.delim, ":., ", ": ")
+        }
 
-    def parse(self, text: str) -> List[LocalDateModel]:
-        date_groups: List[LocalDateModel] = []
-        groups = self.getDateGroups(text)
-        if not groups:
+    def _initTables(self) -> None:
+        self._pattern_table, self._month_table, self._time_table = Dictionary.compileProfile(
+            self.patterns, self.time_patterns
+        )
+        self._iso = self._isoStates()
+
+    def _isoStates(self) -> Optional[Tuple[bool, Dict[Any, int]]]:
+        # What _scanIso needs to know about the profile's tables: whether the
+        # scanner closes "DDDD*DD*DD" at the next delimiter, and the time
+        # state reached after each time form it accepts, keyed by the
+        # character that follows the seconds (None without a fraction). A
+        # form is left out when the scanner would not end on it exactly
+        # where _scanIso does. None disables the fast path.
+        pattern_table = self._pattern_table
+        tree = ROOT_STATE
+        for symbol in "DDDD*DD*DD":
+            tree = pattern_table.next_state(tree, symbol)
+        if not pattern_table.is_accepting(tree):
+            return None
+        time_table = self._time_table
+        times: Dict[Any, int] = {}
+        for fraction, sample in ((None, "00:00:00"), (".", "00:00:00.000"), (",", "00:00:00,000")):
+            time = before = ROOT_STATE
+            for char in sample:
+                before = time
+                time = time_table.next_state(time, char)
+            if time_table.is_accepting(time) and not time_table.is_accepting(before):
+                times[fraction] = time
+                if fraction is not None:
+                    times[ord(fraction)] = time
+        return pattern_table.next_state(tree, "*") == DEAD_STATE, times
+
+    def _initFragmentCaches(self) -> None:
+        # The interpreters reach this Parser through a weak proxy, so neither
+        # they nor their caches hold it in a reference cycle.
+        parser = weakref.proxy(self)
+
+        def interpretDate(s: str, is_alphanumeric: bool) -> Any:
+            return parser.interpretDateFragment(s, is_alphanumeric)
+
+        def interpretTime(s: str, has_am_pm: bool, separator: str) -> Any:
+            return parser.interpretTimeFragment(s, has_am_pm, separator)
+
+        size = self.fragment_cache_size
+        if size:
+            self._date_fragments = functools.lru_cache(maxsize=size)(interpretDate)
+            self._time_fragments = functools.lru_cache(maxsize=size)(interpretTime)
+        else:
+            self._date_fragments = interpretDate
+            self._time_fragments = interpretTime
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The fragment caches wrap bound methods and cannot be pickled; they
+        # are rebuilt empty on the other side. The tables are compiled again
+        # from the profile rather than copied.
+        state = self.__dict__.copy()
+        del state["_date_fragments"]
+        del state["_time_fragments"]
+        del state["_pattern_table"]
+        del state["_month_table"]
+        del state["_time_table"]
+        del state["_iso"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._initTables()
+        self._initFragmentCaches()
+
+    def parse(
+        self,
+        text: TextInput,
+        region: Optional[Tuple[Optional[int], Optional[int]]] = None,
+        first_only: bool = False,
+        workers: Optional[int] = 1,
+        executor: str = "process",
+    ) -> List[LocalDateModel]:
+        """
+        Return every date found in ``text`` (str or ASCII-compatible bytes).
+        See the README for ``region``, ``first_only`` and ``workers``.
+        """
+
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if isinstance(text, _BYTES_TYPES):
+            text = _byteView(text)
+        if region is not None or first_only or not isinstance(text, str):
+            if region is None and not first_only:
+                return self._scanText(text, workers, executor)
+            start, end, _ = slice(*region).indices(len(text)) if region is not None else (0, len(text), 1)
+            results = self._parseRange(text, start, max(start, end), 0)
+            return list(itertools.islice(results, 1)) if first_only else list(results)
+        cache = self._result_cache
+        if cache is None:
+            return self._parseText(text, workers, executor)
+        date_groups = cache.get(text)
+        if date_groups is None:
+            date_groups = self._parseText(text, workers, executor)
+            cache.put(text, date_groups)
+        return date_groups
+
+    def parse_log_line(self, line: TextInput, region: Tuple[Optional[int], Optional[int]] = (0, 64)) -> Optional[LocalDateModel]:
+        """Return the first date (with its time) in ``region`` of ``line``, or None."""
+
+        results = self.parse(line, region=region, first_only=True)
+        return results[0] if results else None
+
+    def _parseText(self, text: str, workers: Optional[int] = 1, executor: str = "process") -> List[LocalDateModel]:
+        if self.learnPattern:
+            return self._parseLearned(text, workers, executor)
+        return self._scanText(text, workers, executor)
+
+    def _scanText(self, text: TextInput, workers: Optional[int], executor: str) -> List[LocalDateModel]:
+        if workers == 1:
+            return list(self.parse_iter(text))
+        return Batch.parseSlices(self, text, workers, executor)
+
+    def _parseLearned(self, text: str, workers: Optional[int] = 1, executor: str = "process") -> List[LocalDateModel]:
+        # The scans run outside the lock; only reading and updating the
+        # learning state is serialized, so threads sharing the Parser never
+        # see a half-updated state.
+        state = self._learning
+        with state.lock:
+            matcher = state.matcher
+            learned = self.learnedPatternString
+        if matcher is not None and learned is not None:
+            missed = False
+            if self.learned_only:
+                date_groups = [
+                    localdate
+                    for start, end in self.iterCandidateRegions(text, anchors=matcher)
+                    for localdate in self._parseRange(text, start, end, 0)
+                    if localdate.identified_date_format == learned
+                ]
+                if not date_groups:
+                    date_groups = self._scanText(text, workers, executor)
+                    missed = bool(date_groups)
+            else:
+                date_groups = self._scanText(text, workers, executor)
+                missed = bool(date_groups) and all(
+                    localdate.identified_date_format != learned for localdate in date_groups
+                )
+            with state.lock:
+                # Another thread may have dropped the pattern meanwhile.
+                if state.matcher is matcher:
+                    state.attempts += 1
+                    if missed:
+                        state.misses += 1
+                    if state.attempts >= self.relearn_window:
+                        if state.misses > self.relearn_miss_rate * state.attempts:
+                            state.reset()
+                            self.learnedPatternString = None
+                        else:
+                            state.attempts = state.misses = 0
             return date_groups
-        for element in groups:
-            localdate = self.getDateFromPhrase(element)
-            if localdate is None:
+
+        date_groups = self._scanText(text, workers, executor)
+        if not date_groups:
+            return date_groups
+        first = date_groups[0]
+        found_format = first.identified_date_format or ""
+        sample = first.original_text or ""
+        with state.lock:
+            if state.matcher is not None:
+                return date_groups
+            if found_format != state.candidate_format:
+                # Shapes are only built once a format repeats.
+                state.candidate_format = found_format
+                state.candidate_sample = sample
+                state.candidate_shape = None
+                state.streak = 1
+            else:
+                shape = Learning.buildShapePattern(sample, found_format)
+                if state.candidate_shape is None:
+                    state.candidate_shape = Learning.buildShapePattern(state.candidate_sample or "", found_format)
+                if shape == state.candidate_shape:
+                    state.streak += 1
+                else:
+                    state.candidate_sample = sample
+                    state.candidate_shape = shape
+                    state.streak = 1
+            if state.streak >= self.learn_after:
+                if state.candidate_shape is None:
+                    state.candidate_shape = Learning.buildShapePattern(sample, found_format)
+                state.matcher = re.compile(state.candidate_shape)
+                self.learnedPatternString = found_format
+        return date_groups
+
+    def cache_info(self) -> CacheInfo:
+        if self._result_cache is None:
+            return CacheInfo()
+        return self._result_cache.info()
+
+    def cache_clear(self) -> None:
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def parse_iter(self, text: TextInput) -> Iterator[LocalDateModel]:
+        """Lazily yield the same LocalDateModel instances parse(text) returns."""
+
+        if isinstance(text, _BYTES_TYPES):
+            text = _byteView(text)
+        return self._parseRange(text, 0, len(text), 0)
+
+    def parse_stream(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[LocalDateModel]:
+        """
+        Yield the dates in a text stream read ``chunk_size`` characters at a
+        time, with absolute offsets.
+        """
+
+        offset = 0
+        buffer = ""
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            buffer = buffer + chunk if buffer else chunk
+            cut = self.getLastResetPosition(buffer, 0, len(buffer))
+            if cut < 0:
                 continue
-            localdate.start = element.startPos
-            localdate.end = element.endPos
-            if element.timeFragment:
-                localdate = self.putTimeInDate(localdate, element)
-            date_fragment = element.getDateFragment() or ""
-            delims = re.sub(r"[A-Za-z0-9]", "", date_fragment)
-            found_format = localdate.identified_date_format or ""
-            if len(delims) == 2:
-                found_format = found_format.replace("$", delims[0])
-                found_format = found_format.replace("&", delims[1])
-            if len(delims) == 3:
-                found_format = found_format.replace("$", delims[0])
-                found_format = found_format.replace("&", delims[1] + delims[2])
-            if element.isAlphaNumeric and Helper.isFullMonth(element.data):
-                found_format = found_format.replace("MMM", "MMMMM")
-            if element.hasAmPm:
-                found_format = f"{found_format} a"
-            localdate.identified_date_format = found_format
-            date_groups.append(localdate)
+            yield from self._parseRange(buffer, 0, cut + 1, offset)
+            offset += cut + 1
+            buffer = buffer[cut + 1 :]
+        if buffer:
+            yield from self._parseRange(buffer, 0, len(buffer), offset)
+
+    def parse_file(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[LocalDateModel]:
+        """Yield the dates in the file at ``path``; see parse_stream."""
+
+        with open(path, "r", encoding=encoding, errors=errors, newline="") as stream:
+            yield from self.parse_stream(stream, chunk_size)
+
+    async def aparse(
+        self,
+        text: str,
+        step: int = DEFAULT_ASYNC_STEP,
+        offload: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> List[LocalDateModel]:
+        """
+        Coroutine form of parse(text) that yields to the event loop between
+        slices, or runs on ``executor`` with ``offload=True``.
+        """
+
+        import asyncio
+
+        if offload:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self.parse, text)
+        date_groups: List[LocalDateModel] = []
+        for start, end in self.iterScanSlices(text, step):
+            date_groups.extend(self._parseRange(text, start, end, 0))
+            await asyncio.sleep(0)
         return date_groups
 
+    async def aparse_stream(
+        self,
+        reader: asyncio.StreamReader,
+        chunk_size: int = DEFAULT_ASYNC_STEP,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+    ) -> AsyncIterator[LocalDateModel]:
+        """Async counterpart of parse_stream for an asyncio.StreamReader."""
+
+        import asyncio
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+        offset = 0
+        buffer = ""
+        while True:
+            data = await reader.read(chunk_size)
+            chunk = decoder.decode(data, final=not data)
+            if chunk:
+                buffer = buffer + chunk if buffer else chunk
+                cut = self.getLastResetPosition(buffer, 0, len(buffer))
+                if cut >= 0:
+                    for localdate in self._parseRange(buffer, 0, cut + 1, offset):
+                        yield localdate
+                    offset += cut + 1
+                    buffer = buffer[cut + 1 :]
+                    await asyncio.sleep(0)
+            if not data:
+                break
+        for localdate in self._parseRange(buffer, 0, len(buffer), offset):
+            yield localdate
+
+    def iterScanSlices(self, text: TextInput, step: int) -> Iterator[Tuple[int, int]]:
+        """
+        Split ``text`` into ``(start, end)`` slices of about ``step`` characters
+        that each end just after a scanner reset position.
+        """
+
+        if step < 1:
+            raise ValueError("step must be at least 1")
+        text_length = len(text)
+        start = 0
+        while start < text_length:
+            limit = min(start + step, text_length)
+            cut = self.getLastResetPosition(text, start, limit)
+            if cut < 0:
+                stop = _resetPattern(text).search(text, limit)
+                cut = text_length - 1 if stop is None else stop.start()
+            yield start, cut + 1
+            start = cut + 1
+
+    def parse_many(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: int = Batch.DEFAULT_BATCH_SIZE,
+        ordered: bool = True,
+        executor: str = "process",
+    ) -> Iterator[Any]:
+        """
+        Yield parse(text) for every input, parsed on a pool of ``workers``; with
+        ``ordered=False`` yield ``(index, results)`` pairs as batches finish.
+        """
+
+        return Batch.parseMany(self, texts, workers, chunksize, ordered, executor)
+
+    def parse_columns(
+        self,
+        text_or_batch: Union[TextInput, Iterable[TextInput]],
+        workers: Optional[int] = 1,
+        chunksize: int = Batch.DEFAULT_BATCH_SIZE,
+        executor: str = "process",
+    ) -> Columns.DateColumns:
+        """Parse a text, or a batch of texts, into NumPy columns (see DateColumns)."""
+
+        Columns.requireNumpy()
+        if isinstance(text_or_batch, (str, *_BYTES_TYPES)):
+            return Columns.buildColumns((0, localdate) for localdate in self.parse_iter(text_or_batch))
+        batches = self.parse_many(text_or_batch, workers=workers, chunksize=chunksize, executor=executor)
+        return Columns.buildColumns(
+            (position, localdate) for position, results in enumerate(batches) for localdate in results
+        )
+
+    def _parseRange(self, text: str, start: int, end: int, offset: int) -> Iterator[LocalDateModel]:
+        if self.prefilter:
+            groups = self.iterCandidateDateGroups(text, start, end)
+        else:
+            groups = self.iterDateGroups(text, start, end)
+        if self.stats is not None:
+            return self._parseRangeTimed(groups, offset, self.stats)
+        return self._convertGroups(groups, offset)
+
+    def _convertGroups(self, groups: Iterator[DateElement], offset: int) -> Iterator[LocalDateModel]:
+        for element in groups:
+            if offset:
+                element.startPos += offset
+                element.endPos += offset
+            localdate = self.getLocalDate(element)
+            if localdate is not None:
+                yield localdate
+
+    def getLocalDate(self, element: DateElement) -> Optional[LocalDateModel]:
+        date = self._interpretDate(element)
+        if date is None:
+            return None
+        time = None
+        if element.timeFragment:
+            time = self._time_fragments(element.timeFragment, element.hasAmPm, element.dateTimeSeprator)
+            if time is not None and element.zoneFragment is not None:
+                time = _withZone(time, element.zoneFragment)
+        # The result derives its strings from these on first access, giving
+        # the same values getDateFromPhrase, putTimeInDate and buildFormat do.
+        return LocalDateModel.fromMatch(element, date, time)
+
+    def _parseRangeTimed(
+        self, groups: Iterator[DateElement], offset: int, stats: ParserStats
+    ) -> Iterator[LocalDateModel]:
+        # Same steps as _convertGroups plus getLocalDate, with each stage
+        # timed; the tallies are merged into ``stats`` once the range is done.
+        clock = perf_counter
+        seconds = dict.fromkeys(STAGES, 0.0)
+        rejected = {"invalid_date": 0, "invalid_time": 0, "error": 0}
+        formats: Dict[str, int] = {}
+        emitted = 0
+        try:
+            while True:
+                began = clock()
+                element = next(groups, None)
+                seconds["getDateGroups"] += clock() - began
+                if element is None:
+                    break
+                emitted += 1
+                if offset:
+                    element.startPos += offset
+                    element.endPos += offset
+                try:
+                    began = clock()
+                    localdate = self.getDateFromPhrase(element)
+                    seconds["getDateFromPhrase"] += clock() - began
+                    if localdate is None:
+                        rejected["invalid_date"] += 1
+                        continue
+                    localdate.start = element.startPos
+                    localdate.end = element.endPos
+                    if element.timeFragment:
+                        began = clock()
+                        date_format = localdate.con_date_format
+                        localdate = self.putTimeInDate(localdate, element)
+                        seconds["putTimeInDate"] += clock() - began
+                        if localdate.con_date_format is date_format:
+                            rejected["invalid_time"] += 1
+                    began = clock()
+                    found_format = self.buildFormat(localdate, element)
+                    seconds["buildFormat"] += clock() - began
+                except Exception:
+                    rejected["error"] += 1
+                    raise
+                localdate.identified_date_format = found_format
+                formats[found_format] = formats.get(found_format, 0) + 1
+                yield localdate
+        finally:
+            stats.recordRange(emitted, seconds, rejected, formats)
+
+    def buildFormat(self, localdate: LocalDateModel, element: DateElement) -> str:
+        """Return the final identified_date_format for ``localdate``."""
+
+        delims, full_month = Formats.fragmentFacts(
+            element.getDateFragment() or "", element.data, element.isAlphaNumeric
+        )
+        return Formats.identifiedFormat(
+            localdate.identified_date_format or "", "", delims, full_month, element.hasAmPm
+        )
+
     def _tokenize(self, text: str, delimiters: str) -> List[str]:
-        if delimiters not in self._tokenizer_cache:
-            pattern = "[" + re.escape(delimiters) + "]+"
-            self._tokenizer_cache[delimiters] = re.compile(pattern)
-        return [token for token in self._tokenizer_cache[delimiters].split(text) if token]
+        # The cache is filled in __init__ and only read here, which keeps
+        # parsing free of writes to shared state.
+        pattern = self._tokenizer_cache.get(delimiters) or self._compileTokenizer(delimiters)
+        return [token for token in pattern.split(text) if token]
+
+    @staticmethod
+    def _compileTokenizer(delimiters: str) -> re.Pattern[str]:
+        return re.compile("[" + re.escape(delimiters) + "]+")
 
     def getDateFromPhrase(self, element: DateElement) -> Optional[LocalDateModel]:
-        if element.timeFragment is None:
-            s = element.data
-        else:
-            s = element.dateFragment or element.data
-        if element.isAlphaNumeric:
+        interpreted = self._interpretDate(element)
+        if interpreted is None:
+            return None
+        date_time_string, con_date_format, identified_date_format, components = interpreted[:4]
+        return LocalDateModel(
+            element.data, date_time_string, con_date_format, identified_date_format, components=components
+        )
+
+    def interpretDateFragment(
+        self, s: str, is_alphanumeric: bool
+    ) -> Optional[Tuple[Optional[str], str, str, DateComponents, str, bool]]:
+        """
+        Return a date fragment's ``(date_time_string, con_date_format,
+        identified_date_format, components, delimiters, full_month)``, or None.
+        """
+
+        interpreted = self._readDateFragment(s, is_alphanumeric)
+        if interpreted is None:
+            return None
+        return interpreted + Formats.fragmentFacts(s, s, is_alphanumeric)
+
+    def _readDateFragment(
+        self, s: str, is_alphanumeric: bool
+    ) -> Optional[Tuple[Optional[str], str, str, DateComponents]]:
+        if is_alphanumeric:
             tokens = self._tokenize(s, self.delim)
             if len(tokens) < 3:
                 return None
@@ -85,9 +655,12 @@ class Parser:
                         day = int(t3)
                     local_date = self.getYyyyMmDdProbable(year, month, day)
                     if local_date:
-                        local_date.original_text = element.data
-                        local_date.identified_date_format = present_format
-                        return local_date
+                        return (
+                            local_date.date_time_string,
+                            local_date.con_date_format,
+                            present_format,
+                            local_date.components,
+                        )
             if Helper.isDigit(t3):
                 year = int(t3)
                 if year > 31:
@@ -102,9 +675,12 @@ class Parser:
                         day = int(t2)
                     local_date = self.getYyyyMmDdProbable(year, month, day)
                     if local_date:
-                        local_date.original_text = element.data
-                        local_date.identified_date_format = present_format
-                        return local_date
+                        return (
+                            local_date.date_time_string,
+                            local_date.con_date_format,
+                            present_format,
+                            local_date.components,
+                        )
             return None
         else:
             if "T" in s or "_" in s:
@@ -116,36 +692,75 @@ class Parser:
             if d1 > 999:
                 local_date = self.getYyyyMmDdProbable(d1, d2, d3)
                 if local_date:
-                    local_date.original_text = element.data
-                    if self.learnPattern and self.learnedPatternString is not None:
-                        self.learnedPatternString = local_date.con_date_format
-                    return local_date
+                    return (
+                        local_date.date_time_string,
+                        local_date.con_date_format,
+                        local_date.identified_date_format,
+                        local_date.components,
+                    )
             if 31 < d1 < 100:
                 local_date = self.getYyMmDdProbable(d1, d2, d3)
                 if local_date:
-                    local_date.original_text = element.data
-                    if self.learnPattern and self.learnedPatternString is not None:
-                        self.learnedPatternString = local_date.con_date_format
-                    return local_date
+                    return (
+                        local_date.date_time_string,
+                        local_date.con_date_format,
+                        local_date.identified_date_format,
+                        local_date.components,
+                    )
             if d3 > 999 and ((0 < d1 < 32) or (0 < d2 < 32)) and d1 > 0 and d2 > 0:
                 local_date = self.getDetemintaionForYyyyPrefix(d1, d2, d3)
                 if local_date:
-                    local_date.original_text = element.data
-                    if self.learnPattern and self.learnedPatternString is not None:
-                        self.learnedPatternString = local_date.con_date_format
-                    return local_date
+                    return (
+                        local_date.date_time_string,
+                        local_date.con_date_format,
+                        local_date.identified_date_format,
+                        local_date.components,
+                    )
             if 31 < d3 < 100 and ((0 < d1 < 32) or (0 < d2 < 32)):
                 local_date = self.getDetemintaionForYyyyPrefix(d1, d2, d3)
                 if local_date:
-                    local_date.original_text = element.data
-                    if self.learnPattern and self.learnedPatternString is not None:
-                        self.learnedPatternString = local_date.con_date_format
-                    return local_date
+                    return (
+                        local_date.date_time_string,
+                        local_date.con_date_format,
+                        local_date.identified_date_format,
+                        local_date.components,
+                    )
         return None
 
+    def _interpretDate(
+        self, element: DateElement
+    ) -> Optional[Tuple[Optional[str], str, str, DateComponents, str, bool]]:
+        if element.timeFragment is None:
+            s = element.data
+        else:
+            s = element.dateFragment or element.data
+        return self._date_fragments(s, element.isAlphaNumeric)
+
     def putTimeInDate(self, localdate: LocalDateModel, element: DateElement) -> LocalDateModel:
+        pieces = self._time_fragments(element.timeFragment or "", element.hasAmPm, element.dateTimeSeprator)
+        if pieces is not None:
+            if element.zoneFragment is not None:
+                pieces = _withZone(pieces, element.zoneFragment)
+            format_string, time_piece, identified_suffix, clock = pieces
+            localdate.con_date_format = sys.intern(f"{localdate.con_date_format} {format_string}")
+            if time_piece is not None:
+                localdate.date_time_string = f"{localdate.date_time_string} {time_piece}"
+            identified = localdate.identified_date_format or ""
+            localdate.identified_date_format = f"{identified}{identified_suffix}"
+            if localdate.components is not None:
+                year, month, day = localdate.components[:3]
+                localdate.components = DateComponents(year, month, day, *clock)
+        return localdate
+
+    def interpretTimeFragment(
+        self, s: str, has_am_pm: bool, separator: str
+    ) -> Optional[Tuple[str, Optional[str], str, Tuple[int, int, int, int]]]:
+        """
+        Return the pieces putTimeInDate appends for a time fragment, or None
+        when it is not a valid time.
+        """
+
         format_string = "HH:mm:ss"
-        s = element.timeFragment or ""
         probable_time_format = format_string
         tokens: Iterable[str]
         if "." in s or "," in s:
@@ -159,22 +774,23 @@ class Parser:
             tokens = self._tokenize(s, ": ")
             hour, minute, second = (int(token) for token in tokens[:3])
             millis = 0
-        if element.hasAmPm:
+        if has_am_pm:
             if "pm" in s.lower():
                 hour = hour + 12
-                probable_time_format = f"{probable_time_format}"
             format_string = format_string.replace("HH", "hh")
             probable_time_format = probable_time_format.replace("HH", "hh")
         if hour < 24 and minute < 60 and second < 60 and millis < 10000:
-            time_piece = f"{hour:02d}:{minute:02d}:{second:02d}"
-            if millis >= 0 and ("." in s or "," in s):
-                time_piece = f"{time_piece}.{millis:03d}"
-            localdate.con_date_format = f"{localdate.con_date_format} {format_string}"
-            localdate.date_time_string = f"{localdate.date_time_string} {time_piece}"
-            sep = "'T'" if element.dateTimeSeprator == "T" else element.dateTimeSeprator
-            identified = localdate.identified_date_format or ""
-            localdate.identified_date_format = f"{identified}{sep}{probable_time_format}"
-        return localdate
+            time_piece = None
+            if self.date_strings:
+                time_piece = f"{hour:02d}:{minute:02d}:{second:02d}"
+                if millis >= 0 and ("." in s or "," in s):
+                    time_piece = f"{time_piece}.{millis:03d}"
+            # A four digit fraction is printed as is (".1234"), so it counts
+            # in tenths of a millisecond.
+            microsecond = millis * 1000 if millis < 1000 else millis * 100
+            sep = "'T'" if separator == "T" else separator
+            return format_string, time_piece, f"{sep}{probable_time_format}", (hour, minute, second, microsecond)
+        return None
 
     def getDetemintaionForYyPrefix(self, d1: int, d2: int, pYear: int) -> Optional[LocalDateModel]:
         return self.getDetemintaionForYyyyPrefix(d1, d2, pYear)
@@ -218,7 +834,6 @@ class Parser:
     def getYyyyMmDdProbable(self, pYear: int, pMonth: int, pDay: int) -> Optional[LocalDateModel]:
         year = pYear
         month = -100
-        day = -100
         format_probable = ""
         if 0 < pMonth < 13:
             month = pMonth
@@ -229,27 +844,13 @@ class Parser:
             format_probable = "dd&MM"
         else:
             return None
-        if month == 2:
-            if year % 4 > 0 and pDay < 29:
-                day = pDay
-            elif year % 4 == 0 and pDay < 30:
-                day = pDay
-            else:
-                return None
-        elif self.is31DayMonth(month):
-            if pDay < 32:
-                day = pDay
-            else:
-                return None
-        elif self.is30DayMonth(month):
-            if pDay < 31:
-                day = pDay
-            else:
-                return None
-        else:
+        # Day 00 is let through, as it always has been.
+        day = pDay
+        if day > Helper.getDaysinMonth(month, year):
             return None
-        localdate = LocalDateModel()
-        localdate.date_time_string = f"{year:04d}-{month:02d}-{day:02d}"
+        localdate = LocalDateModel(components=DateComponents(year, month, day))
+        if self.date_strings:
+            localdate.date_time_string = f"{year:04d}-{month:02d}-{day:02d}"
         localdate.con_date_format = "yyyy-MM-dd"
         if 9 < year < 100:
             format_probable = "yy$" + format_probable
@@ -258,10 +859,87 @@ class Parser:
         localdate.identified_date_format = format_probable
         return localdate
 
-    def getDateGroups(self, text: str) -> Optional[List[DateElement]]:
-        date_groups: Optional[List[DateElement]] = None
-        possible_date = ["\x00"] * 30
-        possible_time = ["\x00"] * 17
+    def getCandidateRegions(self, text: str) -> List[Tuple[int, int]]:
+        return list(self.iterCandidateRegions(text))
+
+    def iterCandidateRegions(
+        self, text: str, start: int = 0, end: Optional[int] = None, anchors: Pattern[str] = _DIGIT_PATTERN
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Yield ``(start, end)`` ranges around the ``anchors`` matches (digits by
+        default) that start and end at scanner reset positions.
+        """
+
+        region: Optional[Tuple[int, int]] = None
+        reset = _resetPattern(text)
+        if anchors is _DIGIT_PATTERN and not isinstance(text, str):
+            anchors = _DIGIT_BYTES_PATTERN
+        text_length = len(text) if end is None else end
+        floor = start
+        anchor = anchors.search(text, start, text_length)
+        while anchor is not None:
+            position = anchor.start()
+            region_start = max(floor, self.getLastResetPosition(text, floor, position))
+            stop = reset.search(text, position + 1, text_length)
+            region_end = text_length if stop is None else stop.start() + 1
+            if region is not None and region_start < region[1]:
+                region = (region[0], region_end)
+            else:
+                if region is not None:
+                    yield region
+                region = (region_start, region_end)
+            if stop is None:
+                break
+            floor = stop.start()
+            anchor = anchors.search(text, region_end, text_length)
+        if region is not None:
+            yield region
+
+    def getLastResetPosition(self, text: str, start: int, end: int) -> int:
+        """
+        Return the position of the last character in ``text[start:end]`` at
+        which the scanner is guaranteed to reset, or -1 if there is none.
+        """
+
+        reset = _resetPattern(text)
+        lookback = 64
+        while True:
+            low = max(start, end - lookback)
+            position = -1
+            for found in reset.finditer(text, low, end):
+                position = found.start()
+            if position >= 0 or low == start:
+                return position
+            end = low
+            lookback *= 2
+
+    def getCandidateDateGroups(self, text: str) -> Optional[List[DateElement]]:
+        return list(self.iterCandidateDateGroups(text)) or None
+
+    def iterCandidateDateGroups(self, text: str, start: int = 0, end: Optional[int] = None) -> Iterator[DateElement]:
+        for region_start, region_end in self.iterCandidateRegions(text, start, end):
+            yield from self.iterDateGroups(text, region_start, region_end)
+
+    def getDateGroups(self, text: str, start: int = 0, end: Optional[int] = None) -> Optional[List[DateElement]]:
+        return list(self.iterDateGroups(text, start, end)) or None
+
+    def iterDateGroups(self, text: str, start: int = 0, end: Optional[int] = None) -> Iterator[DateElement]:
+        """Scan ``text[start:end]`` and yield each DateElement once it is closed."""
+
+        date_groups: List[DateElement] = []
+        # The fragment being read is prefix + text[frag_start:count]; prefix
+        # only holds text when the scanner skipped a character mid-fragment.
+        # Its time part starts at time_start. i and time_frg_length count the
+        # characters kept, which excludes repeated spaces.
+        is_text = isinstance(text, str)
+        # Byte input is classified by byte value; fragments are only turned
+        # into str when they are emitted.
+        space = " " if is_text else 32
+        empty = "" if is_text else b""
+        char_markers = _CHAR_MARKERS
+        prefix = empty
+        frag_start = start
+        time_start = start
         i = 0
         end_found_earlier = False
         month_determined = False
@@ -271,266 +949,449 @@ class Parser:
         is_alphanumeric = False
         date_time_separator = " "
         whitespace_count = 0
-        tree = Dictionary.patternPredictionTree
-        month = Dictionary.monthPredictionTree
-        time = Dictionary.timePredictionTree
-        text_length = len(text)
-        for count in range(text_length):
-            c = text[count]
-            if i == 0:
-                tree = Dictionary.patternPredictionTree
-                is_alphanumeric = False
-            if i > 1 and possible_date[i - 1] == " " and c == " ":
-                whitespace_count += 1
-                continue
-            if search_for_time_piece:
-                time_determined = time.explict_date_fragment
-                if time_frg_length > 12 and possible_time[time_frg_length - 1] == " ":
-                    time_determined = True
-                if Helper.isDigit(c):
-                    time = time.get_child("D")
-                else:
-                    time = time.get_child(c.lower())
-                if time is None:
-                    if time_determined:
-                        date_groups = self.addTimeFragment(
-                            date_groups, possible_date, possible_time, count, i, time_frg_length, date_time_separator
-                        )
-                    if time_frg_length > 0 and self.isValidTimeFragmentWithEndingDelim(possible_time):
-                        possible_time[time_frg_length - 1] = " "
-                        if i > 0:
-                            possible_date[i - 1] = " "
-                        date_groups = self.addTimeFragment(
-                            date_groups, possible_date, possible_time, count, i - 1, time_frg_length, date_time_separator
-                        )
-                    search_for_time_piece = False
-                    possible_date = self.nullifyBuffer(possible_date)
-                    possible_time = self.nullifyBuffer(possible_time)
-                    end_found_earlier = False
-                    time = Dictionary.timePredictionTree
-                    i = 0
-                    whitespace_count = 0
-                    time_frg_length = 0
+        pattern_table = self._pattern_table
+        pattern_next = pattern_table.transitions
+        pattern_accept = pattern_table.accepting
+        pattern_width = pattern_table.width
+        pattern_classes = pattern_table.classes
+        month_table = self._month_table
+        month_next = month_table.transitions
+        month_accept = month_table.accepting
+        month_width = month_table.width
+        month_classes = month_table.classes
+        time_table = self._time_table
+        time_next = time_table.transitions
+        time_accept = time_table.accepting
+        time_width = time_table.width
+        time_classes = time_table.classes
+        tree = ROOT_STATE
+        month = ROOT_STATE
+        time = ROOT_STATE
+        text_length = len(text) if end is None else end
+        # Instrumentation stays out of the per-character path: every scanned
+        # character is assumed to take one table step and transition_delta,
+        # touched only in rare branches, corrects for those taking none or two.
+        stats = self.stats
+        transition_delta = 0
+        abandoned = 0
+        pending = 0
+        count = start - 1
+        # Positions the ISO fast path consumed are skipped by advancing this.
+        positions = iter(range(start, text_length))
+        iso = self._iso
+        dash = "-" if is_text else 45
+        try:
+            for count in positions:
+                if date_groups:
+                    # Closing the generator here leaves text[count] unscanned.
+                    pending = 1
+                    if not search_for_time_piece:
+                        yield from date_groups
+                        date_groups.clear()
+                    elif len(date_groups) > 1:
+                        yield from date_groups[:-1]
+                        del date_groups[:-1]
+                    pending = 0
+                c = text[count]
+                if i == 0:
+                    tree = ROOT_STATE
+                    is_alphanumeric = False
+                    frag_start = count
+                    prefix = empty
+                if c == space and i > 1 and (text[count - 1] if count > frag_start else prefix[-1] if prefix else None) == space:
+                    whitespace_count += 1
+                    transition_delta -= 1
                     continue
-                else:
-                    if time_determined:
-                        if count == text_length - 1:
+                if search_for_time_piece:
+                    time_determined = time_accept[time]
+                    if time_frg_length > 12 and text[count - 1] == space:
+                        time_determined = True
+                    time = time_next[time * time_width + time_classes.get(c, 0)]
+                    if time == DEAD_STATE:
+                        date_part = prefix + text[frag_start:time_start]
+                        if time_determined:
                             date_groups = self.addTimeFragment(
-                                date_groups, possible_date, possible_time, count, i, time_frg_length, date_time_separator
+                                date_groups, date_part, text[time_start:count], count, time_frg_length, date_time_separator
                             )
-                            search_for_time_piece = False
-                            possible_date = self.nullifyBuffer(possible_date)
-                            possible_time = self.nullifyBuffer(possible_time)
-                            end_found_earlier = False
-                            time = Dictionary.timePredictionTree
-                            i = 0
-                            whitespace_count = 0
-                            time_frg_length = 0
-                            continue
-                        if c == " ":
-                            try:
-                                next_chars = text[count + 1 : count + 3]
+                        if time_frg_length > 0 and self.isValidTimeFragmentWithEndingDelim(
+                            _collapseSpaces(_asText(text[time_start:count])).strip()
+                        ):
+                            # Drop the delimiter that ended the time.
+                            date_groups = self.addTimeFragment(
+                                date_groups,
+                                date_part,
+                                text[time_start : count - 1],
+                                count,
+                                time_frg_length,
+                                date_time_separator,
+                            )
+                        search_for_time_piece = False
+                        end_found_earlier = False
+                        time = ROOT_STATE
+                        i = 0
+                        whitespace_count = 0
+                        time_frg_length = 0
+                        continue
+                    else:
+                        if time_determined:
+                            if count == text_length - 1:
+                                date_groups = self.addTimeFragment(
+                                    date_groups,
+                                    prefix + text[frag_start:time_start],
+                                    text[time_start:count],
+                                    count,
+                                    time_frg_length,
+                                    date_time_separator,
+                                )
+                                search_for_time_piece = False
+                                end_found_earlier = False
+                                time = ROOT_STATE
+                                i = 0
+                                whitespace_count = 0
+                                time_frg_length = 0
+                                continue
+                            if c == space:
+                                time_end = count
+                                next_chars = _asText(text[count + 1 : min(count + 3, text_length)])
                                 if next_chars.lower() in {"am", "pm"}:
-                                    possible_time[time_frg_length] = c
-                                    time_frg_length += 1
-                                    possible_date[i] = c
-                                    i += 1
-
-                                    possible_time[time_frg_length] = text[count + 1]
+                                    time_end = count + 3
+                                    time_frg_length += 3
+                                    i += 3
+                                date_groups = self.addTimeFragment(
+                                    date_groups,
+                                    prefix + text[frag_start:time_start],
+                                    text[time_start:time_end],
+                                    count,
+                                    time_frg_length,
+                                    date_time_separator,
+                                )
+                                search_for_time_piece = False
+                                end_found_earlier = False
+                                time = ROOT_STATE
+                                i = 0
+                                whitespace_count = 0
+                                time_frg_length = 0
+                                continue
+                        else:
+                            if count == text_length - 1 and time_accept[time]:
+                                time_end = count
+                                if char_markers.get(c) == "D":
+                                    time_end = count + 1
                                     time_frg_length += 1
-                                    possible_date[i] = text[count + 1]
                                     i += 1
-
-                                    possible_time[time_frg_length] = text[count + 2]
+                                date_groups = self.addTimeFragment(
+                                    date_groups,
+                                    prefix + text[frag_start:time_start],
+                                    text[time_start:time_end],
+                                    count,
+                                    time_frg_length,
+                                    date_time_separator,
+                                )
+                                search_for_time_piece = False
+                                end_found_earlier = False
+                                time = ROOT_STATE
+                                i = 0
+                                whitespace_count = 0
+                                time_frg_length = 0
+                                continue
+                        time_frg_length += 1
+                        i += 1
+                    continue
+                symbol = char_markers.get(c)
+                if symbol is not None:
+                    if (
+                        i == 0
+                        and symbol == "D"
+                        and iso is not None
+                        and count + 9 < text_length
+                        and text[count + 4] == dash
+                        and time == ROOT_STATE
+                        and (marker != "M" or not month_determined)
+                    ):
+                        scanned_iso = self._scanIso(text, count, text_length, date_groups)
+                        if scanned_iso is not None:
+                            resume, marker, separator = scanned_iso
+                            if separator is not None:
+                                date_time_separator = separator
+                            if marker == "M":
+                                month_determined = False
+                            month = ROOT_STATE
+                            transition_delta -= resume - count
+                            if resume - count > 1:
+                                next(itertools.islice(positions, resume - count - 2, None), None)
+                            count = resume - 1
+                            continue
+                    if marker == "M":
+                        if month_determined:
+                            is_alphanumeric = True
+                            tree = pattern_next[tree * pattern_width + pattern_classes[marker]]
+                            if tree == DEAD_STATE and end_found_earlier:
+                                prefix += text[frag_start:count]
+                                frag_start = count + 1
+                                continue
+                            transition_delta += 1
+                        else:
+                            if i:
+                                abandoned += 1
+                            tree = ROOT_STATE
+                            frag_start = count
+                            prefix = empty
+                            i = 0
+                            whitespace_count = 0
+                            end_found_earlier = False
+                        month = ROOT_STATE
+                    marker = symbol
+                    if tree == DEAD_STATE:
+                        transition_delta -= 1
+                        if end_found_earlier:
+                            date_groups = self.addDateFragment(
+                                date_groups,
+                                prefix + text[frag_start:count],
+                                count,
+                                time_frg_length + i + whitespace_count,
+                                is_alphanumeric,
+                            )
+                            is_alphanumeric = False
+                            if symbol == "D":
+                                transition_delta += 1
+                                time = time_next[time * time_width + time_classes[c]]
+                                if time != DEAD_STATE:
+                                    time_start = count
                                     time_frg_length += 1
-                                    possible_date[i] = text[count + 2]
+                                    search_for_time_piece = True
                                     i += 1
-                            except IndexError:
-                                pass
-                            date_groups = self.addTimeFragment(
-                                date_groups, possible_date, possible_time, count, i, time_frg_length, date_time_separator
-                            )
-                            search_for_time_piece = False
-                            possible_date = self.nullifyBuffer(possible_date)
-                            possible_time = self.nullifyBuffer(possible_time)
+                                else:
+                                    i = 0
+                                    whitespace_count = 0
+                                    end_found_earlier = False
+                            else:
+                                i = 0
+                                whitespace_count = 0
+                                end_found_earlier = False
                             end_found_earlier = False
-                            time = Dictionary.timePredictionTree
+                            tree = ROOT_STATE
+                            month = ROOT_STATE
+                            continue
+                        else:
+                            if i:
+                                abandoned += 1
                             i = 0
                             whitespace_count = 0
-                            time_frg_length = 0
+                            end_found_earlier = False
+                            tree = ROOT_STATE
+                            month = ROOT_STATE
                             continue
-                    else:
-                        if count == text_length - 1 and time.explict_date_fragment:
-                            if Helper.isDigit(c):
-                                possible_time[time_frg_length] = c
-                                time_frg_length += 1
-                                possible_date[i] = c
-                                i += 1
-                            date_groups = self.addTimeFragment(
-                                date_groups, possible_date, possible_time, count, i, time_frg_length, date_time_separator
+                    tree = pattern_next[tree * pattern_width + pattern_classes[marker]]
+                    if tree == DEAD_STATE:
+                        if end_found_earlier:
+                            date_groups = self.addDateFragment(
+                                date_groups,
+                                prefix + text[frag_start:count],
+                                count,
+                                time_frg_length + i + whitespace_count,
+                                is_alphanumeric,
                             )
-                            search_for_time_piece = False
-                            possible_date = self.nullifyBuffer(possible_date)
-                            possible_time = self.nullifyBuffer(possible_time)
                             end_found_earlier = False
-                            time = Dictionary.timePredictionTree
-                            i = 0
-                            whitespace_count = 0
-                            time_frg_length = 0
-                            continue
-                    possible_time[time_frg_length] = c
-                    time_frg_length += 1
-                    possible_date[i] = c
-                    i += 1
-                continue
-            if Helper.isDigit(c) or Helper.isDelimeter(c) or Helper.isTimeSeprator(c):
-                if marker == "M":
-                    if month_determined:
-                        is_alphanumeric = True
-                        tree = tree.get_child(marker)
-                        if tree is None and end_found_earlier:
-                            continue
-                    else:
-                        tree = Dictionary.patternPredictionTree
-                        possible_date = self.nullifyBuffer(possible_date)
-                        i = 0
-                        whitespace_count = 0
-                        end_found_earlier = False
-                    month = Dictionary.monthPredictionTree
-                marker = "D" if Helper.isDigit(c) else "*"
-                if tree is None:
-                    if end_found_earlier:
-                        date_groups = self.addDateFragment(
-                            date_groups, possible_date, count, time_frg_length + i + whitespace_count, is_alphanumeric
-                        )
-                        is_alphanumeric = False
-                        if Helper.isDigit(c):
-                            time = time.get_child("D")
-                            if time is not None:
-                                possible_time[time_frg_length] = c
-                                time_frg_length += 1
+                            is_alphanumeric = False
+                            if c in _TIME_SEPARATORS:
                                 search_for_time_piece = True
-                                possible_date[i] = c
+                                time_start = count + 1
                                 i += 1
+                                date_time_separator = c if is_text else chr(c)
                             else:
-                                possible_date = self.nullifyBuffer(possible_date)
                                 i = 0
                                 whitespace_count = 0
-                                end_found_earlier = False
+                            tree = ROOT_STATE
+                            month = ROOT_STATE
                         else:
-                            possible_date = self.nullifyBuffer(possible_date)
-                            i = 0
-                            whitespace_count = 0
-                            end_found_earlier = False
-                        end_found_earlier = False
-                        tree = Dictionary.patternPredictionTree
-                        month = Dictionary.monthPredictionTree
+                            prefix += text[frag_start:count]
+                            frag_start = count + 1
                         continue
                     else:
-                        possible_date = self.nullifyBuffer(possible_date)
+                        i += 1
+                        end_found_earlier = pattern_accept[tree]
+                        if count == text_length - 1 and end_found_earlier:
+                            date_groups = self.addDateFragment(
+                                date_groups,
+                                prefix + text[frag_start : count + 1],
+                                count,
+                                time_frg_length + i + whitespace_count,
+                                is_alphanumeric,
+                            )
+                            is_alphanumeric = False
+                            break
+                else:
+                    marker = "M"
+                    month = month_next[month * month_width + month_classes.get(c, 0)]
+                    if month == DEAD_STATE:
+                        if not i:
+                            # Nothing is being read (the rest of the state is
+                            # already reset): the common case in plain words.
+                            month = ROOT_STATE
+                            month_determined = False
+                            continue
+                        if end_found_earlier:
+                            date_groups = self.addDateFragment(
+                                date_groups,
+                                prefix + text[frag_start:count],
+                                count,
+                                time_frg_length + i + whitespace_count,
+                                is_alphanumeric,
+                            )
+                            is_alphanumeric = False
+                            end_found_earlier = False
+                        elif i:
+                            abandoned += 1
                         i = 0
                         whitespace_count = 0
+                        month = ROOT_STATE
+                        tree = ROOT_STATE
+                        month_determined = False
                         end_found_earlier = False
-                        tree = Dictionary.patternPredictionTree
-                        month = Dictionary.monthPredictionTree
                         continue
-                tree = tree.get_child(marker)
-                if tree is None:
-                    if end_found_earlier:
-                        date_groups = self.addDateFragment(
-                            date_groups, possible_date, count, time_frg_length + i + whitespace_count, is_alphanumeric
-                        )
-                        end_found_earlier = False
-                        is_alphanumeric = False
-                        if Helper.isTimeSeprator(c):
-                            search_for_time_piece = True
-                            possible_date[i] = c
-                            i += 1
-                            date_time_separator = c
-                        else:
-                            possible_date = self.nullifyBuffer(possible_date)
-                            i = 0
-                            whitespace_count = 0
-                        tree = Dictionary.patternPredictionTree
-                        month = Dictionary.monthPredictionTree
-                    continue
-                else:
-                    possible_date[i] = c
-                    i += 1
-                    end_found_earlier = tree.explict_date_fragment
-                    if count == text_length - 1 and end_found_earlier:
-                        date_groups = self.addDateFragment(
-                            date_groups, possible_date, count, time_frg_length + i + whitespace_count, is_alphanumeric
-                        )
-                        is_alphanumeric = False
-                        break
-            else:
-                marker = "M"
-                c_lower = c.lower()
-                month = month.get_child(c_lower)
-                if month is None:
-                    if end_found_earlier:
-                        date_groups = self.addDateFragment(
-                            date_groups, possible_date, count, time_frg_length + i + whitespace_count, is_alphanumeric
-                        )
-                        is_alphanumeric = False
-                        end_found_earlier = False
-                    possible_date = self.nullifyBuffer(possible_date)
-                    i = 0
-                    whitespace_count = 0
-                    month = Dictionary.monthPredictionTree
-                    tree = Dictionary.patternPredictionTree
-                    month_determined = False
-                    end_found_earlier = False
-                    continue
-                else:
-                    month_determined = month.explict_date_fragment
-                    possible_date[i] = c_lower
-                    i += 1
-        return date_groups
+                    else:
+                        month_determined = month_accept[month]
+                        i += 1
+            yield from date_groups
+        finally:
+            if stats is not None:
+                scanned = count + 1 - start - pending
+                stats.recordScan(scanned, scanned + transition_delta, abandoned)
+
+    def _scanIso(
+        self, text: TextInput, position: int, end: int, date_groups: List[DateElement]
+    ) -> Optional[Tuple[int, str, Optional[str]]]:
+        # Fast path of iterDateGroups for a fragment that starts with a
+        # canonical ISO-8601 timestamp (and "Z" or "+hh:mm" offset): appends
+        # the elements the general scanner would build and returns (resume,
+        # marker, separator), or None, before touching date_groups, when
+        # the general scanner would read the text differently.
+        is_text = text.__class__ is str
+        found = (_ISO_PATTERN if is_text else _ISO_BYTES_PATTERN).match(text, position, end)  # type: ignore[call-overload]
+        if found is None:
+            return None
+        closes, times = self._iso  # type: ignore[misc]
+        space = " " if is_text else 32
+        date_end = position + 10
+        match_end = found.end()
+        if match_end == date_end:
+            if date_end == end:
+                # At the end of the text the scanner closes the date on its
+                # last character rather than after it.
+                self.addDateFragment(date_groups, text[position:date_end], date_end - 1, 10, False)
+                return end, "D", None
+            c = text[date_end]
+            symbol = _CHAR_MARKERS.get(c)
+            if symbol == "D":
+                return None
+            if symbol is None:
+                month_table = self._month_table
+                if month_table.transitions[ROOT_STATE * month_table.width + month_table.classes.get(c, 0)]:
+                    return None
+                self.addDateFragment(date_groups, text[position:date_end], date_end, 10, False)
+                return date_end + 1, "M", None
+            if not closes:
+                return None
+            if c not in _TIME_SEPARATORS:
+                self.addDateFragment(date_groups, text[position:date_end], date_end, 10, False)
+                return date_end + 1, "*", None
+            # The scanner now looks for a time, and the next character ends
+            # that search unless it is a digit or a repeated space.
+            resume = min(date_end + 2, end)
+            if resume > date_end + 1:
+                following = text[date_end + 1]
+                if _CHAR_MARKERS.get(following) == "D" or following == c == space:
+                    return None
+            self.addDateFragment(date_groups, text[position:date_end], date_end, 10, False)
+            return resume, "*", c if is_text else chr(c)  # type: ignore[arg-type]
+        if not closes:
+            return None
+        fraction = found.start(1)
+        time = times.get(None if fraction < 0 else text[fraction])
+        if time is None:
+            return None
+        zone_start = found.start(2)
+        if zone_start >= 0 and match_end - zone_start > 1 and match_end < end and text[match_end] != space:
+            # "+hh:mm" must end where the scanner would start over: when
+            # digits, delimiters or letters run on (a range such as
+            # "...:34-2025-12-13"), it is not an offset. "Z" is itself a
+            # reset character.
+            if not _resetPattern(text).match(text, match_end):
+                match_end = zone_start
+                zone_start = -1
+        time_end = match_end if zone_start < 0 else zone_start
+        if time_end < end:
+            c = text[time_end]
+            time_table = self._time_table
+            if time_table.transitions[time * time_table.width + time_table.classes.get(c, 0)]:
+                # Only a space can go on from a complete time, and it still
+                # ends it unless AM/PM follows.
+                if c != space:
+                    return None
+                if time_end + 1 < end and _asText(text[time_end + 1 : min(time_end + 3, end)]).lower() in ("am", "pm"):
+                    return None
+            close = time_end
+            resume = time_end + 1
+        else:
+            close = end - 1
+            resume = end
+        if zone_start >= 0:
+            close = resume = match_end
+        separator = text[date_end]
+        if not is_text:
+            separator = chr(separator)  # type: ignore[arg-type]
+        self.addDateFragment(date_groups, text[position:date_end], date_end, 10, False)
+        self.addTimeFragment(
+            date_groups, text[position : date_end + 1], text[date_end + 1 : time_end], close, time_end - date_end - 1, separator
+        )
+        if zone_start >= 0:
+            element = date_groups[-1]
+            element.zoneFragment = _asText(text[zone_start:match_end])
+            element.data += element.zoneFragment
+        return resume, "*", separator  # type: ignore[return-value]
 
     def addDateFragment(
         self,
         date_groups: Optional[List[DateElement]],
-        possible_date: List[str],
+        date_part: str,
         count: int,
         pattern_length: int,
         is_alphanumeric: bool,
     ) -> Optional[List[DateElement]]:
         if date_groups is None:
             date_groups = []
-        date_element = self.createDateFragment(possible_date, count, pattern_length, is_alphanumeric)
+        date_element = self.createDateFragment(date_part, count, pattern_length, is_alphanumeric)
         if date_element is not None:
             date_groups.append(date_element)
         return date_groups
 
-    def isValidTimeFragmentWithEndingDelim(self, possible_time: List[str]) -> bool:
-        s = self._buffer_to_string(possible_time)
-        original = s
-        s = re.sub(r"[0-9]", "", s)
+    def isValidTimeFragmentWithEndingDelim(self, time_text: str) -> bool:
+        s = re.sub(r"[0-9]", "", time_text)
         if 2 < len(s) <= 3:
-            if s.startswith("::") and (original.endswith(",") or original.endswith(".")):
+            if s.startswith("::") and (time_text.endswith(",") or time_text.endswith(".")):
                 return True
         return False
 
     def addTimeFragment(
         self,
         date_groups: Optional[List[DateElement]],
-        possible_date: List[str],
-        possible_time: List[str],
+        date_part: str,
+        time_part: str,
         count: int,
-        i: int,
         time_frg_length: int,
         date_time_separator: str,
     ) -> Optional[List[DateElement]]:
         if not date_groups:
             return date_groups
+        date_part = _asText(date_part)
+        time_part = _asText(time_part)
+        time_text = _collapseSpaces(time_part)
         ele = date_groups[-1]
-        ele.data = self._buffer_to_string(possible_date)
+        ele.data = _collapseSpaces(date_part.translate(_MONTH_CASE_FOLD) + time_part).strip()
         ele.endPos = count
-        ele.timeFragment = self._buffer_to_string(possible_time)
+        ele.timeFragment = time_text.strip()
         if time_frg_length >= 2:
-            ampm = f"{possible_time[time_frg_length - 2]}{possible_time[time_frg_length - 1]}"
+            ampm = time_text[-2:]
             if ampm.lower() in {"am", "pm"}:
                 ele.hasAmPm = True
                 ele.endPos = count + 3
@@ -538,9 +1399,9 @@ class Parser:
         return date_groups
 
     def createDateFragment(
-        self, buffer: List[str], position: int, length: int, is_alphanumeric: bool
+        self, date_part: str, position: int, length: int, is_alphanumeric: bool
     ) -> Optional[DateElement]:
-        date_text = self._buffer_to_string(buffer)
+        date_text = _collapseSpaces(_asText(date_part).translate(_MONTH_CASE_FOLD)).strip()
         if not date_text:
             return None
         ele = DateElement(date_text)
@@ -551,45 +1412,11 @@ class Parser:
         ele.dateFragment = ele.data
         return ele
 
-    def nullifyBuffer(self, buffer: List[str]) -> List[str]:
-        for idx in range(len(buffer)):
-            buffer[idx] = "\x00"
-        return buffer
-
-    def _buffer_to_string(self, buffer: List[str]) -> str:
-        return "".join(ch for ch in buffer if ch and ch != "\x00").strip()
-
     def is31DayMonth(self, value: int) -> bool:
-        return value in {1, 3, 5, 7, 8, 10, 12}
+        return 0 < value < 13 and Dictionary.DAYS_IN_MONTH[value] == 31
 
     def is30DayMonth(self, value: int) -> bool:
-        return value in {4, 6, 9, 11}
+        return 0 < value < 13 and Dictionary.DAYS_IN_MONTH[value] == 30
 
     def monthToDigit(self, text: str) -> int:
-        text = text.lower()
-        month_map = {
-            "jan": 1,
-            "january": 1,
-            "feb": 2,
-            "february": 2,
-            "mar": 3,
-            "march": 3,
-            "apr": 4,
-            "april": 4,
-            "may": 5,
-            "jun": 6,
-            "june": 6,
-            "jul": 7,
-            "july": 7,
-            "aug": 8,
-            "august": 8,
-            "sep": 9,
-            "september": 9,
-            "oct": 10,
-            "october": 10,
-            "nov": 11,
-            "november": 11,
-            "dec": 12,
-            "december": 12,
-        }
-        return month_map.get(text, -1)
+        return Dictionary.MONTH_NUMBERS.get(text.lower(), -1)
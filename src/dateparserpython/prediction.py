@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+DEAD_STATE = 0
+ROOT_STATE = 1
+DIGITS = "0123456789"
 
 
 @dataclass
@@ -35,3 +39,79 @@ class PredictionModelNode:
     def children_count(self) -> int:
         return len(self.childern)
 
+
+@dataclass(frozen=True)
+class CompiledPredictionModel:
+    """
+    Flat DFA form of a PredictionModelNode trie. States are integers, with
+    DEAD_STATE absorbing every transition and ROOT_STATE standing for the
+    trie root. ``classes`` maps an input character, and for characters below
+    256 also its byte value, to its column in the row-major
+    ``transitions`` table; unknown characters use column 0, which
+    always leads to DEAD_STATE. Instances are shared by every Parser and
+    thread, so ``classes`` must be treated as read-only.
+    """
+
+    classes: Dict[Union[str, int], int]
+    width: int
+    transitions: Tuple[int, ...]
+    accepting: Tuple[bool, ...]
+
+    def char_class(self, char: Union[str, int]) -> int:
+        return self.classes.get(char, 0)
+
+    def next_state(self, state: int, char: Union[str, int]) -> int:
+        return self.transitions[state * self.width + self.classes.get(char, 0)]
+
+    def is_accepting(self, state: int) -> bool:
+        return self.accepting[state]
+
+    @classmethod
+    def from_tree(
+        cls, tree: PredictionModelNode, digit_symbol: Optional[str] = None, fold_case: bool = False
+    ) -> "CompiledPredictionModel":
+        """
+        Compile ``tree`` into transition tables. When ``digit_symbol`` is
+        given, every ASCII digit takes the edge labelled with that symbol
+        (the symbol itself no longer matches); ``fold_case`` additionally
+        routes upper-case letters through their lower-case edges, matching
+        the scanner's ``c.lower()`` lookups.
+        """
+
+        alphabet: List[str] = []
+        nodes: List[PredictionModelNode] = [tree]
+        index = 0
+        while index < len(nodes):
+            for child in nodes[index].childern:
+                if child.charcter not in alphabet:
+                    alphabet.append(child.charcter)
+                nodes.append(child)
+            index += 1
+
+        classes: Dict[Union[str, int], int] = {}
+        symbol_class: Dict[str, int] = {}
+        for position, symbol in enumerate(alphabet, start=1):
+            symbol_class[symbol] = position
+            if symbol == digit_symbol:
+                for digit in DIGITS:
+                    classes[digit] = position
+                continue
+            if symbol in DIGITS and digit_symbol is not None:
+                continue
+            classes.setdefault(symbol, position)
+            if fold_case and symbol.upper() != symbol and len(symbol.upper()) == 1:
+                classes.setdefault(symbol.upper(), position)
+        for char, position in list(classes.items()):
+            if isinstance(char, str) and len(char) == 1 and ord(char) < 256:
+                classes.setdefault(ord(char), position)
+        width = len(alphabet) + 1
+
+        state_of = {id(node): ROOT_STATE + offset for offset, node in enumerate(nodes)}
+        transitions = [DEAD_STATE] * ((len(nodes) + 1) * width)
+        accepting = [False] * (len(nodes) + 1)
+        for node in nodes:
+            state = state_of[id(node)]
+            accepting[state] = node.explict_date_fragment
+            for child in node.childern:
+                transitions[state * width + symbol_class[child.charcter]] = state_of[id(child)]
+        return cls(classes, width, tuple(transitions), tuple(accepting))
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Tuple
+
+# Stage names reported under "stage_seconds", in pipeline order.
+STAGES = ("getDateGroups", "getDateFromPhrase", "putTimeInDate", "buildFormat")
+# Reasons reported under "rejected".
+REJECT_REASONS = ("scanner", "invalid_date", "invalid_time", "error")
+
+
+class ParserStats:
+    """
+    Thread-safe counters collected by a Parser created with
+    ``collect_stats=True``. Each scanned range is tallied locally and merged
+    here once, so the lock is taken per range rather than per character.
+
+    snapshot() returns a plain dict:
+
+    - ``chars_scanned``: characters fed to the scanner.
+    - ``trie_transitions``: steps taken in the pattern, month and time tables.
+    - ``fragments_started`` / ``fragments_emitted``: fragments the scanner
+      began buffering / handed to interpretation.
+    - ``results``: LocalDateModel instances produced.
+    - ``rejected``: fragments dropped, by reason: ``scanner`` (abandoned
+      before it matched a pattern), ``invalid_date``, ``invalid_time`` (the
+      date was kept without its time) and ``error`` (interpretation raised).
+    - ``results_by_format``: result count per identified_date_format.
+    - ``stage_seconds``: cumulative wall time per stage; scanning is timed
+      while the scanner runs, between the results it yields.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._chars = 0
+            self._transitions = 0
+            self._started = 0
+            self._emitted = 0
+            self._results = 0
+            self._rejected = dict.fromkeys(REJECT_REASONS, 0)
+            self._formats: Dict[str, int] = {}
+            self._seconds = dict.fromkeys(STAGES, 0.0)
+
+    def recordScan(self, chars: int, transitions: int, abandoned: int) -> None:
+        with self._lock:
+            self._chars += chars
+            self._transitions += transitions
+            self._started += abandoned
+            self._rejected["scanner"] += abandoned
+
+    def recordRange(
+        self, emitted: int, seconds: Dict[str, float], rejected: Dict[str, int], formats: Dict[str, int]
+    ) -> None:
+        with self._lock:
+            self._started += emitted
+            self._emitted += emitted
+            for stage, elapsed in seconds.items():
+                self._seconds[stage] += elapsed
+            for reason, count in rejected.items():
+                self._rejected[reason] += count
+            for found_format, count in formats.items():
+                self._formats[found_format] = self._formats.get(found_format, 0) + count
+                self._results += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "chars_scanned": self._chars,
+                "trie_transitions": self._transitions,
+                "fragments_started": self._started,
+                "fragments_emitted": self._emitted,
+                "results": self._results,
+                "rejected": dict(self._rejected),
+                "results_by_format": dict(self._formats),
+                "stage_seconds": dict(self._seconds),
+            }
+
+    def __reduce__(self) -> Tuple[type, Tuple[()]]:
+        # Worker processes start with empty counters; their tallies are not
+        # merged back into the parent.
+        return ParserStats, ()
@@ -0,0 +1,53 @@
+"""UTC offsets after ISO-8601 times must not swallow what follows them."""
+
+import pytest
+
+from dateparserpython import Parser
+
+
+def _found(text):
+    return [(r.original_text, r.identified_date_format) for r in Parser().parse(text)]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2025-12-12 02:10:34+05:30", [("2025-12-12 02:10:34+05:30", "yyyy-MM-dd HH:mm:ssXXX")]),
+        ("2025-12-12T02:10:34Z x", [("2025-12-12T02:10:34Z", "yyyy-MM-dd'T'HH:mm:ssXXX")]),
+        ("2025-12-12T02:10:34-08:00 y", [("2025-12-12T02:10:34-08:00", "yyyy-MM-dd'T'HH:mm:ssXXX")]),
+    ],
+)
+def test_offset_is_part_of_the_match(text, expected):
+    assert _found(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2025-12-12 02:10:34-2025-12-13 02:10:34", ["2025-12-12 02:10:34", "2025-12-13 02:10:34"]),
+        ("2025-12-12T02:10:34.235-2025-12-13T02:10:34.235", ["2025-12-12T02:10:34.235", "2025-12-13T02:10:34.235"]),
+        ("2025-12-12 02:10:34 - 2025-12-13 02:10:34", ["2025-12-12 02:10:34", "2025-12-13 02:10:34"]),
+    ],
+)
+def test_date_range_keeps_both_ends(text, expected):
+    assert [original for original, _ in _found(text)] == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2025-12-12 02:10:34.235-1900", "2025-12-12 02:10:34.235"),
+        ("2025-12-12 02:10:34+2025", "2025-12-12 02:10:34"),
+        ("2025-12-12 02:10:34-0800", "2025-12-12 02:10:34"),
+    ],
+)
+def test_time_followed_by_digits_is_not_an_offset(text, expected):
+    results = Parser().parse(text)
+    assert [r.original_text for r in results] == [expected]
+    assert results[0].components.tzinfo is None
+
+
+def test_time_followed_by_a_date():
+    found = _found("2025-12-12 02:10:34+02:10:34 and 12/12/2020")
+    assert found[0] == ("2025-12-12 02:10:34", "yyyy-MM-dd HH:mm:ss")
+    assert found[-1] == ("12/12/2020", "MM/dd/yyyy")
@@ -0,0 +1,70 @@
+"""parse(text, workers=N) must return exactly what a sequential parse does."""
+
+import random
+
+import pytest
+
+from dateparserpython import Parser
+from dateparserpython import batch as Batch
+
+PIECES = [
+    "12", "2020", "1", "31", "99", "-", "/", ".", ",", ":", "_", "+", "T", "x", "foo",
+    "jan", "January", "sept", "12/12/2020", "12 Dec 2025", "December 12, 2025",
+    "2025-12-12T02:10:34Z", "2025-12-12 02:10:34.235+05:30", "2025-12-12 02:10:34",
+]
+SEPARATORS = [" ", " ", "  ", "\n", " | "]
+INPUTS = {
+    "str": lambda text: text,
+    "bytes": lambda text: text.encode(),
+    "memoryview": lambda text: memoryview(text.encode()),
+}
+
+
+def _values(results):
+    return [
+        (r.original_text, r.date_time_string, r.con_date_format, r.identified_date_format, r.start, r.end, r.components)
+        for r in results
+    ]
+
+
+def _texts(seed, count=5):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(PIECES) + rng.choice(SEPARATORS) for _ in range(rng.randint(200, 1500)))
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    # Tiny slices, so that even these short texts are cut into many of them.
+    monkeypatch.setattr(Batch, "MIN_SLICE_SIZE", 16)
+    created = []
+    createPool = Batch._createPool
+
+    def counting(*args):
+        created.append(args)
+        return createPool(*args)
+
+    monkeypatch.setattr(Batch, "_createPool", counting)
+    return created
+
+
+@pytest.mark.parametrize("executor", Batch.EXECUTORS)
+@pytest.mark.parametrize("kind", sorted(INPUTS))
+def test_parallel_matches_sequential(pools, executor, kind):
+    parser = Parser()
+    texts = list(_texts(seed=len(kind) * 31 + len(executor)))
+    for text in texts:
+        data = INPUTS[kind](text)
+        expected = _values(parser.parse(data))
+        assert expected
+        for workers in (2, 3):
+            assert _values(parser.parse(data, workers=workers, executor=executor)) == expected
+    assert len(pools) == 2 * len(texts)
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_workers_below_one_are_rejected(workers):
+    with pytest.raises(ValueError):
+        Parser().parse("12 Dec 2025", workers=workers)
+    with pytest.raises(ValueError):
+        list(Parser().parse_many(["12 Dec 2025"], workers=workers))